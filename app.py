@@ -1,16 +1,28 @@
 import streamlit as st
 import sys
 import os
+import time
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Make project packages importable (once, even though Streamlit re-executes this script)
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+@st.cache_resource
+def _get_deploy_executor():
+    """Worker pool running deployments off the script thread"""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=4)
 
-from ui.layout import main_layout
-from ui.form import deployment_form
-from ui.response import show_success_response
-from services.deployer import DeploymentService
 
 def main():
     """Main Streamlit application for Free Backend Hosting"""
+    # UI modules are only needed when the page actually renders
+    from ui.layout import main_layout
+    from ui.form import deployment_form
+    from ui.response import show_success_response, DEPLOYMENT_TROUBLESHOOTING_MD
+    from ui.shared import get_deployment_service
     
     # Configure page
     st.set_page_config(
@@ -23,9 +35,8 @@ def main():
     # Apply main layout
     main_layout()
     
-    # Initialize deployment service
-    if 'deployment_service' not in st.session_state:
-        st.session_state.deployment_service = DeploymentService()
+    # Shared deployment service (per-user results live in session state)
+    service = get_deployment_service()
     
     # Show enhanced deployment form
     github_url, env_file, requirements_file, submit = deployment_form()
@@ -41,29 +52,35 @@ def main():
                 del st.session_state.deployment_successful
             if 'deployment_error' in st.session_state:
                 del st.session_state.deployment_error
-            st.experimental_rerun()
+            st.rerun()
+    
+    # Handle deployment submission (ignored while a deployment is still running)
+    if submit and github_url and requirements_file and 'deploy_future' not in st.session_state:
+        # Read files (getvalue returns the whole buffer regardless of the file pointer)
+        env_file_content = env_file.getvalue().decode("utf-8") if env_file else None
+        requirements_content = requirements_file.getvalue().decode("utf-8") if requirements_file else None
+        
+        # Deploy in the background so reruns don't block on (or repeat) the work
+        st.session_state.deploy_future = _get_deploy_executor().submit(
+            service.deploy_repository,
+            github_url=github_url,
+            env_file_content=env_file_content,
+            custom_requirements=requirements_content
+        )
     
-    # Handle deployment submission
-    if submit and github_url and requirements_file:
-        # Read files
-        env_file_content = None
-        if env_file:
-            env_file_content = env_file.read().decode("utf-8")
-            env_file.seek(0)  # Reset file pointer
+    # Poll the running deployment
+    deploy_future = st.session_state.get('deploy_future')
+    if deploy_future is not None:
+        if not deploy_future.done():
+            with st.spinner("🔄 Processing deployment..."):
+                time.sleep(1)
+            st.rerun()
         
-        requirements_content = None
-        if requirements_file:
-            requirements_content = requirements_file.read().decode("utf-8")
-            requirements_file.seek(0)  # Reset file pointer
+        del st.session_state.deploy_future
         
         # Deploy with enhanced error handling
         try:
-            with st.spinner("🔄 Processing deployment..."):
-                result = st.session_state.deployment_service.deploy_repository(
-                    github_url=github_url,
-                    env_file_content=env_file_content,
-                    custom_requirements=requirements_content
-                )
+            result = deploy_future.result()
             
             # Store result in session state to prevent loss on rerun
             if result.get("success"):
@@ -86,28 +103,7 @@ def main():
             st.error(f"❌ Deployment failed: {st.session_state.deployment_error}")
             
             # Show troubleshooting tips
-            with st.expander("🔧 Troubleshooting Tips"):
-                st.markdown("""
-                **Common issues and solutions:**
-                
-                1. **Repository validation failed**
-                   - Ensure the GitHub URL is correct and public
-                   - Check your internet connection
-                
-                2. **FastAPI not detected**
-                   - Verify your repository has FastAPI app with `app = FastAPI()`
-                   - Check files like `main.py`, `app.py`, or similar
-                
-                3. **File access issues (Windows)**
-                   - Temporary files cleanup may show warnings (this is normal)
-                   - The deployment process should still work correctly
-                
-                4. **Requirements issues**
-                   - Ensure requirements.txt has valid package names
-                   - Check for any syntax errors in the file
-                
-                **Need more help?** Try with a different repository or check our documentation.
-                """)
+            st.expander("🔧 Troubleshooting Tips").markdown(DEPLOYMENT_TROUBLESHOOTING_MD)
 
 if __name__ == "__main__":
     main()
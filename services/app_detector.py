@@ -1,67 +1,112 @@
+import hashlib
+import mmap
 import os
 import re
+import subprocess
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import ast
 
 
+# Same patterns and scoring as before: each import pattern found adds 30 and is
+# reported by its pattern text, each app pattern found adds 40. Bytes patterns so
+# they can run directly over a memory-mapped file without decoding it.
+_IMPORT_PATTERNS = [
+    (pattern, re.compile(pattern.encode(), re.IGNORECASE))
+    for pattern in (
+        r'from\s+fastapi\s+import\s+FastAPI',
+        r'import\s+fastapi',
+        r'from\s+fastapi\s+import\s+.*FastAPI',
+    )
+]
+_APP_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        rb'app\s*=\s*FastAPI\(',
+        rb'application\s*=\s*FastAPI\(',
+        rb'api\s*=\s*FastAPI\(',
+        rb'server\s*=\s*FastAPI\(',
+        rb'fastapi_app\s*=\s*FastAPI\(',
+    )
+]
+
+# Every import and app pattern contains this, so files without it skip the regexes
+_FASTAPI_RE = re.compile(rb'fastapi', re.IGNORECASE)
+
+# Route decorators (+20) and uvicorn (+10) are plain substring checks
+_ROUTE_MARKERS = (b'@app.route', b'@app.get', b'@app.post')
+
+# Files smaller than this are read directly; mmap setup isn't worth it
+_MMAP_MIN_SIZE = 4096
+
+# Common main file names
+_MAIN_FILE_NAMES = frozenset({"main.py", "app.py", "server.py", "api.py", "run.py"})
+
+# File names that earn a bonus when picking the recommended app (run.py is usually a launcher)
+_PREFERRED_APP_NAMES = _MAIN_FILE_NAMES - {"run.py"}
+
+# Directories that never contain the user's application code
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", "venv", "site-packages"})
+
+# Assignment of a FastAPI instance, e.g. `app = FastAPI(` or `api = fastapi.FastAPI(`
+_APP_ASSIGN_RE = re.compile(r'(\w+)\s*=\s*(?:fastapi\.)?FastAPI\(')
+
+
+# Scan results kept by tree fingerprint, least recently used first
+_SCAN_CACHE_SIZE = 32
+_scan_cache = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+class _AppVariableFound(Exception):
+    """Raised by _FastAPIFinder to stop traversal at the first match"""
+    
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
+
+
+class _FastAPIFinder(ast.NodeVisitor):
+    """Find the first `name = FastAPI(...)` assignment outside functions and classes"""
+    
+    def visit_Assign(self, node: ast.Assign):
+        if isinstance(node.value, ast.Call):
+            func = node.value.func
+            is_fastapi = (
+                (isinstance(func, ast.Name) and func.id == 'FastAPI') or
+                (isinstance(func, ast.Attribute) and func.attr == 'FastAPI')
+            )
+            if is_fastapi and node.targets and isinstance(node.targets[0], ast.Name):
+                raise _AppVariableFound(node.targets[0].id)
+    
+    def visit_FunctionDef(self, node):
+        # App instances are module-level in practice; don't descend into bodies
+        pass
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_ClassDef = visit_FunctionDef
+
+
 class FastAPIDetector:
     """Detect FastAPI applications in repository"""
     
-    def __init__(self):
-        self.app_patterns = [
-            r'app\s*=\s*FastAPI\(',
-            r'application\s*=\s*FastAPI\(',
-            r'api\s*=\s*FastAPI\(',
-            r'server\s*=\s*FastAPI\(',
-            r'fastapi_app\s*=\s*FastAPI\(',
-        ]
-        
-        self.import_patterns = [
-            r'from\s+fastapi\s+import\s+FastAPI',
-            r'import\s+fastapi',
-            r'from\s+fastapi\s+import\s+.*FastAPI',
-        ]
-    
     def scan_directory_for_fastapi(self, directory: str) -> Dict[str, any]:
         """Scan directory for FastAPI applications"""
         try:
-            results = {
-                "found_apps": [],
-                "python_files": [],
-                "potential_main_files": [],
-                "has_fastapi": False
-            }
-            
-            # Common main file names
-            main_file_names = ["main.py", "app.py", "server.py", "api.py", "run.py"]
-            
-            # Scan for Python files
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith('.py'):
-                        file_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(file_path, directory)
-                        results["python_files"].append(rel_path)
-                        
-                        # Check if it's a potential main file
-                        if file in main_file_names:
-                            results["potential_main_files"].append(rel_path)
-                        
-                        # Analyze file for FastAPI
-                        fastapi_info = self.analyze_python_file(file_path)
-                        if fastapi_info["has_fastapi"]:
-                            results["has_fastapi"] = True
-                            results["found_apps"].append({
-                                "file": rel_path,
-                                "app_instances": fastapi_info["app_instances"],
-                                "imports": fastapi_info["imports"],
-                                "confidence": fastapi_info["confidence"]
-                            })
-            
-            # Determine best app file
-            if results["found_apps"]:
-                results["recommended_app"] = self.get_recommended_app(results["found_apps"])
+            # Rescanning an unchanged tree (e.g. redeploying the same commit) hits the cache
+            fingerprint = self._directory_fingerprint(directory)
+            with _scan_cache_lock:
+                if fingerprint in _scan_cache:
+                    _scan_cache.move_to_end(fingerprint)
+                    return _scan_cache[fingerprint]
             
+            results = self._scan_directory(directory)
+            with _scan_cache_lock:
+                _scan_cache[fingerprint] = results
+                if len(_scan_cache) > _SCAN_CACHE_SIZE:
+                    _scan_cache.popitem(last=False)
             return results
             
         except Exception as e:
@@ -73,12 +118,98 @@ class FastAPIDetector:
                 "error": str(e)
             }
     
+    def _directory_fingerprint(self, directory: str) -> str:
+        """Cheap key that changes whenever the scanned sources change"""
+        # Fresh clones land in a new temp directory each time, so prefer the commit id
+        if os.path.isdir(os.path.join(directory, '.git')):
+            try:
+                head = subprocess.run(
+                    ["git", "-C", directory, "rev-parse", "HEAD"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                if head.returncode == 0 and head.stdout.strip():
+                    return f"git:{head.stdout.strip()}"
+            except (OSError, subprocess.SubprocessError):
+                pass
+        
+        # Not a git checkout (e.g. an extracted tarball, which lands in a fresh temp
+        # directory but keeps the commit's mtimes): key on relative paths and stats
+        base_len = len(directory if directory.endswith(os.sep) else directory + os.sep)
+        stats = []
+        for entry in self._iter_py_files(directory):
+            info = entry.stat()
+            stats.append((entry.path[base_len:], info.st_size, info.st_mtime_ns))
+        stats.sort()
+        return f"tree:{hashlib.sha1(repr(stats).encode()).hexdigest()}"
+    
+    def _scan_directory(self, directory: str) -> Dict[str, any]:
+        """Walk directory and analyze its Python files"""
+        results = {
+            "found_apps": [],
+            "python_files": [],
+            "potential_main_files": [],
+            "has_fastapi": False
+        }
+        
+        # Every entry path starts with the scan root, so slicing replaces os.path.relpath
+        base_len = len(directory if directory.endswith(os.sep) else directory + os.sep)
+        
+        # Collect Python files first; analysis is I/O bound and runs in parallel below
+        py_files = []
+        for entry in self._iter_py_files(directory):
+            rel_path = entry.path[base_len:]
+            py_files.append((entry.path, rel_path))
+            results["python_files"].append(rel_path)
+            
+            # Check if it's a potential main file
+            if entry.name in _MAIN_FILE_NAMES:
+                results["potential_main_files"].append(rel_path)
+        
+        # Analyze files for FastAPI (map keeps results in walk order)
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            analyses = executor.map(self.analyze_python_file, [path for path, _ in py_files])
+            
+            for (_, rel_path), fastapi_info in zip(py_files, analyses):
+                if fastapi_info["has_fastapi"]:
+                    results["has_fastapi"] = True
+                    results["found_apps"].append({
+                        "file": rel_path,
+                        "app_instances": fastapi_info["app_instances"],
+                        "imports": fastapi_info["imports"],
+                        "confidence": fastapi_info["confidence"],
+                        "source": fastapi_info["source"]
+                    })
+        
+        # Determine best app file
+        if results["found_apps"]:
+            results["recommended_app"] = self.get_recommended_app(results["found_apps"])
+        
+        return results
+    
+    def _iter_py_files(self, directory: str):
+        """Yield DirEntry objects for Python files, skipping .git and vendored directories"""
+        pending = deque([directory])
+        
+        while pending:
+            current = pending.popleft()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.py'):
+                            yield entry
+            except OSError:
+                # Unreadable directory, keep scanning the rest of the tree
+                continue
+    
     def analyze_python_file(self, file_path: str) -> Dict[str, any]:
         """Analyze a Python file for FastAPI usage"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             result = {
                 "has_fastapi": False,
                 "app_instances": [],
@@ -86,27 +217,12 @@ class FastAPIDetector:
                 "confidence": 0
             }
             
-            # Check for FastAPI imports
-            for pattern in self.import_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    result["has_fastapi"] = True
-                    result["imports"].append(pattern)
-                    result["confidence"] += 30
-            
-            # Check for FastAPI app instances
-            for pattern in self.app_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    result["has_fastapi"] = True
-                    result["app_instances"].extend(matches)
-                    result["confidence"] += 40
-            
-            # Additional checks
-            if '@app.route' in content or '@app.get' in content or '@app.post' in content:
-                result["confidence"] += 20
-            
-            if 'uvicorn' in content:
-                result["confidence"] += 10
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                    self._scan_buffer(f.read(), result)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self._scan_buffer(mm, result)
             
             return result
             
@@ -119,20 +235,47 @@ class FastAPIDetector:
                 "error": str(e)
             }
     
+    def _scan_buffer(self, buffer, result: Dict[str, any]) -> None:
+        """Accumulate FastAPI matches from a bytes-like buffer into result"""
+        if _FASTAPI_RE.search(buffer) is not None:
+            # Check for FastAPI imports
+            for pattern, compiled in _IMPORT_PATTERNS:
+                if compiled.search(buffer):
+                    result["has_fastapi"] = True
+                    result["imports"].append(pattern)
+                    result["confidence"] += 30
+            
+            # Check for FastAPI app instances
+            for compiled in _APP_PATTERNS:
+                matches = compiled.findall(buffer)
+                if matches:
+                    result["has_fastapi"] = True
+                    result["app_instances"].extend(match.decode("utf-8", "replace") for match in matches)
+                    result["confidence"] += 40
+        
+        # Additional checks
+        if any(buffer.find(marker) != -1 for marker in _ROUTE_MARKERS):
+            result["confidence"] += 20
+        
+        if buffer.find(b'uvicorn') != -1:
+            result["confidence"] += 10
+        
+        # Keep the text of (the few) positive files so callers needn't re-read them
+        if result["has_fastapi"]:
+            result["source"] = bytes(buffer).decode("utf-8", "replace")
+    
     def get_recommended_app(self, found_apps: List[Dict]) -> Dict[str, any]:
         """Get the most likely main application file"""
         if not found_apps:
             return {}
         
-        # Sort by confidence and prefer main file names
-        main_names = ["main.py", "app.py", "server.py", "api.py"]
-        
+        # Rank by confidence and prefer main file names
         def score_app(app):
             score = app["confidence"]
             
             # Bonus for common main file names
             filename = os.path.basename(app["file"])
-            if filename in main_names:
+            if filename in _PREFERRED_APP_NAMES:
                 score += 50
             
             # Bonus for being in root directory
@@ -141,41 +284,28 @@ class FastAPIDetector:
             
             return score
         
-        sorted_apps = sorted(found_apps, key=score_app, reverse=True)
-        return sorted_apps[0]
+        # Only the best candidate is needed; max keeps the first one on ties like a stable sort
+        return max(found_apps, key=score_app)
     
     def extract_app_variable_name(self, file_content: str) -> Optional[str]:
         """Extract the variable name of FastAPI app instance"""
-        try:
-            # Try to parse with AST
-            tree = ast.parse(file_content)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    # Check if right side is a FastAPI call
-                    if isinstance(node.value, ast.Call):
-                        if hasattr(node.value.func, 'id') and node.value.func.id == 'FastAPI':
-                            if node.targets and hasattr(node.targets[0], 'id'):
-                                return node.targets[0].id
-                        elif hasattr(node.value.func, 'attr') and node.value.func.attr == 'FastAPI':
-                            if node.targets and hasattr(node.targets[0], 'id'):
-                                return node.targets[0].id
-            
-            # Fallback to regex
-            patterns = [
-                r'(\w+)\s*=\s*FastAPI\(',
-                r'(\w+)\s*=\s*fastapi\.FastAPI\(',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, file_content)
-                if match:
-                    return match.group(1)
-            
+        if "FastAPI" not in file_content:
             return "app"  # Default fallback
-            
+        
+        # A single unambiguous assignment is the common case; no parse needed
+        matches = _APP_ASSIGN_RE.findall(file_content)
+        if len(matches) == 1:
+            return matches[0]
+        
+        try:
+            # Ambiguous or unusual code, let the AST decide
+            _FastAPIFinder().visit(ast.parse(file_content))
+        except _AppVariableFound as found:
+            return found.name
         except Exception:
-            return "app"  # Default fallback
+            pass
+        
+        return matches[0] if matches else "app"  # Default fallback
     
     def get_uvicorn_command(self, app_file: str, app_variable: str = "app") -> str:
         """Generate uvicorn command for the app"""
@@ -2,9 +2,11 @@
 FastAPI Deployment Orchestrator
 """
 import os
+import re
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
-from datetime import datetime
 
 from .git_clone import GitHubRepoHandler
 from .app_detector import FastAPIDetector
@@ -13,16 +15,22 @@ from .colab_generator import ColabNotebookGenerator
 from .single_cell_generator import SingleCellGenerator
 
 
+# Env var names that suggest a credential
+_SENSITIVE_RE = re.compile(r'password|secret|key|token', re.IGNORECASE)
+
+
 class DeploymentService:
     """Main deployment service orchestrator"""
     
+    # Handlers keep no per-deployment state, so all service instances share one set
+    # instead of rebuilding the object graph (and its HTTP/cell caches) each time
+    repo_handler = GitHubRepoHandler()
+    app_detector = FastAPIDetector()
+    env_handler = EnvironmentHandler()
+    notebook_generator = ColabNotebookGenerator()
+    single_cell_generator = SingleCellGenerator()
+    
     def __init__(self):
-        self.repo_handler = GitHubRepoHandler()
-        self.app_detector = FastAPIDetector()
-        self.env_handler = EnvironmentHandler()
-        self.notebook_generator = ColabNotebookGenerator()
-        self.single_cell_generator = SingleCellGenerator()
-        
         self.deployment_status = {}
     
     def deploy_repository(self, 
@@ -34,24 +42,33 @@ class DeploymentService:
                          python_version: str = "3.10") -> Dict:
         """Main deployment function"""
         
-        deployment_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Nanosecond clock in hex: unique even for deploys within the same second
+        deployment_id = f"{time.time_ns():016x}"
+        temp_dir = None
         
         try:
-            # Step 1: Validate and analyze repository
+            # Steps 1 & 2: Validate/analyze the repository and clone it for detailed
+            # analysis. Both are independent network I/O, so overlap them
             print("🔍 Validating GitHub repository...")
-            repo_analysis = self.repo_handler.analyze_repository_structure(github_url)
+            print("📥 Cloning repository for analysis...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                analysis_future = executor.submit(self.repo_handler.analyze_repository_structure, github_url)
+                clone_future = executor.submit(self.repo_handler.clone_repository_temp, github_url)
+                
+                # Take the clone first so temp_dir is known (and cleaned up) even if analysis raises
+                clone_success, temp_dir, clone_message = clone_future.result()
+                repo_analysis = analysis_future.result()
             
             if not repo_analysis["valid"]:
+                # The clone raced ahead of validation; discard it
+                if clone_success:
+                    self.repo_handler.cleanup_temp_directory(temp_dir)
                 return {
                     "success": False,
                     "error": repo_analysis["error"],
                     "step": "repository_validation"
                 }
             
-            # Step 2: Clone repository temporarily for detailed analysis
-            print("📥 Cloning repository for analysis...")
-            clone_success, temp_dir, clone_message = self.repo_handler.clone_repository_temp(github_url)
-            
             if not clone_success:
                 return {
                     "success": False,
@@ -83,18 +100,19 @@ class DeploymentService:
                 
                 app_file = recommended_app["file"]
                 
-                # Extract app variable name
-                with open(os.path.join(temp_dir, app_file), 'r', encoding='utf-8') as f:
-                    app_content = f.read()
-                app_variable = self.app_detector.extract_app_variable_name(app_content)
+                # Extract app variable name from the source the detector already read
+                app_variable = self.app_detector.extract_app_variable_name(recommended_app.get("source", ""))
                 
                 # Step 4: Get requirements
                 print("📋 Processing requirements...")
                 requirements_content = custom_requirements
                 
                 if not requirements_content:
-                    # Try to get from repository
-                    requirements_content = self.repo_handler.get_requirements_content(github_url)
+                    # Read from the clone we already have instead of another GitHub API call
+                    req_path = os.path.join(temp_dir, 'requirements.txt')
+                    if os.path.isfile(req_path):
+                        with open(req_path, 'r', encoding='utf-8', errors='replace') as f:
+                            requirements_content = f.read()
                 
                 # Step 5: Process environment variables
                 print("🔐 Processing environment variables...")
@@ -137,22 +155,21 @@ class DeploymentService:
                     ngrok_auth=ngrok_auth
                 )
                 
-                # Step 8: Save single cell code to TXT file
-                single_cell_filename = f"fastapi_deploy_single_cell_{deployment_id}.txt"
-                single_cell_path = os.path.join('generated_notebooks', single_cell_filename)
-                
-                os.makedirs('generated_notebooks', exist_ok=True)
-                with open(single_cell_path, 'w', encoding='utf-8') as f:
-                    f.write(single_cell_code)
-                
-                # Step 9: Save notebook
+                # Step 8: Save notebook (the generator creates generated_notebooks/ once)
                 notebook_filename = f"fastapi_deploy_{deployment_id}.ipynb"
                 notebook_path = self.notebook_generator.save_notebook(
                     notebook_result["notebook"], 
                     notebook_filename
                 )
                 
-                # Step 9: Prepare response
+                # Step 9: Save single cell code to TXT file next to the notebook
+                single_cell_filename = f"fastapi_deploy_single_cell_{deployment_id}.txt"
+                single_cell_path = os.path.join(os.path.dirname(notebook_path), single_cell_filename)
+                
+                with open(single_cell_path, 'wb') as f:
+                    f.write(single_cell_code.encode('utf-8'))
+                
+                # Step 10: Prepare response
                 return {
                     "success": True,
                     "deployment_id": deployment_id,
@@ -178,9 +195,7 @@ class DeploymentService:
                     "environment": {
                         "vars_count": len(env_vars),
                         "has_sensitive_vars": any(
-                            pattern in key.lower() 
-                            for key in env_vars.keys() 
-                            for pattern in ['password', 'secret', 'key', 'token']
+                            _SENSITIVE_RE.search(key) for key in env_vars
                         ) if env_vars else False,
                         "validation_warnings": env_validation.get("warnings", [])
                     },
@@ -207,11 +222,12 @@ class DeploymentService:
                 
             finally:
                 # Cleanup temporary directory
-                self.repo_handler.cleanup_temp_directory()
+                self.repo_handler.cleanup_temp_directory(temp_dir)
                 
         except Exception as e:
             # Ensure cleanup happens even on error
-            self.repo_handler.cleanup_temp_directory()
+            if temp_dir:
+                self.repo_handler.cleanup_temp_directory(temp_dir)
             
             return {
                 "success": False,
@@ -1,10 +1,44 @@
+import re
 from typing import Dict, List
-import streamlit as st
+
+
+# Fixed parts of the code emitted by generate_env_injection_code
+_INJECTION_HEADER = (
+    "# Setting up environment variables\n"
+    "import os\n"
+    "print('Setting environment variables...')\n"
+    "\n"
+)
+_INJECTION_FOOTER = (
+    "\n"
+    "\n"
+    "print(f'✅ Set {count} environment variables')\n"
+    "print('Environment variables: ' + ', '.join({keys!r}))"
+)
+
+# Escapes for a double-quoted Python string literal
+_DOUBLE_QUOTE_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
 
 
 class EnvironmentHandler:
     """Handle environment variables processing"""
     
+    # One KEY=VALUE line: comments and lines without '=' never match, surrounding
+    # whitespace is dropped and one pair of matching quotes is stripped from the value
+    _LINE_RE = re.compile(
+        r'^(?![^\S\n]*#)[^\S\n]*([^=\n]*?)[^\S\n]*=[^\S\n]*'
+        r'(?:"(.*)"|\'(.*)\'|(.*?))[^\S\n]*$',
+        re.MULTILINE
+    )
+    
+    # Names that probably hold credentials: warned about on validation...
+    _SENSITIVE_RE = re.compile(r'password|secret|key|token|api', re.IGNORECASE)
+    # ...and masked when displayed (API_URL and the like stay readable)
+    _MASKED_RE = re.compile(r'password|secret|key|token', re.IGNORECASE)
+    
+    # Letters, digits, '_' and '-' only
+    _VALID_KEY_RE = re.compile(r'[\w-]+')
+    
     def __init__(self):
         self.env_vars = {}
     
@@ -12,35 +46,20 @@ class EnvironmentHandler:
         """Parse .env file content"""
         env_vars = {}
         
-        try:
-            lines = env_content.strip().split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Split on first = only
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    env_vars[key] = value
-            
-            return env_vars
-            
-        except Exception as e:
-            st.error(f"Error parsing .env file: {e}")
-            return {}
+        # Single regex pass over the whole buffer instead of per-line str calls
+        for match in self._LINE_RE.finditer(env_content):
+            key, double_quoted, single_quoted, raw = match.groups()
+            if double_quoted is not None:
+                env_vars[key] = double_quoted
+            elif single_quoted is not None:
+                env_vars[key] = single_quoted
+            elif raw in ('"', "'"):
+                # A lone quote opens and closes itself, as the old split/strip parser had it
+                env_vars[key] = ''
+            else:
+                env_vars[key] = raw
+        
+        return env_vars
     
     def validate_env_vars(self, env_vars: Dict[str, str]) -> Dict[str, any]:
         """Validate environment variables"""
@@ -60,12 +79,11 @@ class EnvironmentHandler:
                     continue
                 
                 # Check for invalid characters in key
-                if not key.replace('_', '').replace('-', '').isalnum():
+                if not self._VALID_KEY_RE.fullmatch(key):
                     result["warnings"].append(f"Variable '{key}' contains special characters")
                 
                 # Check for sensitive data patterns
-                sensitive_patterns = ['password', 'secret', 'key', 'token', 'api']
-                if any(pattern in key.lower() for pattern in sensitive_patterns):
+                if self._SENSITIVE_RE.search(key):
                     result["warnings"].append(f"Variable '{key}' appears to contain sensitive data")
                 
                 result["processed_vars"][key] = value
@@ -82,41 +100,23 @@ class EnvironmentHandler:
         if not env_vars:
             return "# No environment variables to set\nprint('No environment variables configured')"
         
-        code_lines = [
-            "# Setting up environment variables",
-            "import os",
-            "print('Setting environment variables...')",
-            ""
-        ]
-        
-        for key, value in env_vars.items():
-            # Escape quotes in value
-            escaped_value = value.replace('"', '\\"')
-            code_lines.append(f'os.environ["{key}"] = "{escaped_value}"')
+        body = "\n".join(
+            f'os.environ["{key}"] = "{value.translate(_DOUBLE_QUOTE_ESCAPES)}"'
+            for key, value in env_vars.items()
+        )
         
-        code_lines.extend([
-            "",
-            f"print(f'✅ Set {len(env_vars)} environment variables')",
-            "print('Environment variables: ' + ', '.join(env_vars.keys()))"
-        ])
-        
-        return "\n".join(code_lines)
+        return _INJECTION_HEADER + body + _INJECTION_FOOTER.format(count=len(env_vars), keys=list(env_vars))
     
     def create_env_file_content(self, env_vars: Dict[str, str]) -> str:
         """Create .env file content"""
         if not env_vars:
             return "# No environment variables"
         
-        lines = ["# Environment variables for deployment"]
-        
-        for key, value in env_vars.items():
-            # Add quotes if value contains spaces
-            if ' ' in value:
-                lines.append(f'{key}="{value}"')
-            else:
-                lines.append(f'{key}={value}')
-        
-        return "\n".join(lines)
+        # Add quotes if value contains spaces
+        return "# Environment variables for deployment\n" + "\n".join(
+            f'{key}="{value}"' if ' ' in value else f'{key}={value}'
+            for key, value in env_vars.items()
+        )
     
     def get_sample_env_vars(self) -> Dict[str, str]:
         """Get sample environment variables for demonstration"""
@@ -136,7 +136,7 @@ class EnvironmentHandler:
         formatted = []
         for key, value in env_vars.items():
             # Mask sensitive values
-            if any(pattern in key.lower() for pattern in ['password', 'secret', 'key', 'token']):
+            if self._MASKED_RE.search(key):
                 masked_value = '*' * min(len(value), 8)
                 formatted.append(f"{key} = {masked_value}")
             else:
@@ -1,23 +1,202 @@
+import base64
+import io
 import os
+import queue
 import tempfile
 import shutil
 import requests
-from typing import Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
 import subprocess
 import stat
+import sys
+import tarfile
+import threading
 import time
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 
+_GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repository metadata, root tree entries and requirements.txt in one round-trip
+_REPO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    description
+    primaryLanguage { name }
+    object(expression: "HEAD:") {
+      ... on Tree { entries { name type } }
+    }
+    requirements: object(expression: "HEAD:requirements.txt") {
+      ... on Blob { text }
+    }
+  }
+}
+"""
+
+# How long a fetched repository stays in repo_info; long enough to cover one user
+# action (validate -> analyze -> requirements) without serving stale trees
+_REPO_INFO_TTL = 60
+
+# Repositories whose REST metadata (and ETag) is kept for conditional requests
+_ETAG_CACHE_SIZE = 128
+
+# Process-wide cap on in-flight GitHub API calls (secondary rate limit)
+_GITHUB_REQUEST_SLOTS = threading.BoundedSemaphore(10)
+
+# Tarball download pipeline: chunk size and how many chunks may wait for the
+# extractor (caps buffered, not-yet-extracted download at ~1.25 MB)
+_TARBALL_CHUNK_SIZE = 64 * 1024
+_TARBALL_QUEUE_SIZE = 20
+
+
+class _ChunkQueueReader(io.RawIOBase):
+    """Read-only file object over byte chunks a producer puts on a queue (None = EOF)"""
+    
+    def __init__(self, chunks: queue.Queue):
+        self._chunks = chunks
+        self._view = memoryview(b"")
+        self._eof = False
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        while not self._view and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._view = memoryview(chunk)
+        
+        size = min(len(buffer), len(self._view))
+        buffer[:size] = self._view[:size]
+        self._view = self._view[size:]
+        return size
+
+
 class GitHubRepoHandler:
     """Handle GitHub repository operations"""
     
     def __init__(self):
-        self.temp_dir = None
+        # normalized github_url -> {"validation", "entries", "requirements", "fetched_at"}
         self.repo_info = {}
+        self._repo_info_lock = threading.Lock()
+        # "owner/repo" -> (etag, payload), least recently used first
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # One keep-alive connection pool for every GitHub API call, so only the
+        # first request pays for the TCP + TLS handshake
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "free-backend-hosting"
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+    
+    def _normalize_github_url(self, github_url: str) -> str:
+        """Canonical form used as the repo_info key"""
+        parsed = urlparse(github_url.strip())
+        path = parsed.path.rstrip('/')
+        if path.endswith('.git'):
+            path = path[:-4]
+        return f"{parsed.scheme}://{parsed.netloc.lower()}{path}"
+    
+    def _split_owner_repo(self, github_url: str) -> Optional[Tuple[str, str]]:
+        """(owner, repo) from a GitHub URL, or None if the path is too short"""
+        path_parts = urlparse(github_url).path.strip('/').split('/')
+        if len(path_parts) < 2:
+            return None
+        
+        owner, repo = path_parts[0], path_parts[1]
+        
+        # Remove .git suffix if present
+        if repo.endswith('.git'):
+            repo = repo[:-4]
+        
+        return owner, repo
+    
+    def _fetch_repo_meta(self, owner: str, repo: str) -> Tuple[int, Optional[Dict[str, any]]]:
+        """GET /repos/{owner}/{repo}, revalidating a cached payload with its ETag"""
+        key = f"{owner}/{repo}".lower()
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        
+        # A 304 answer to If-None-Match doesn't count against the rate limit
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        with _GITHUB_REQUEST_SLOTS:
+            response = self._session.get(f"https://api.github.com/repos/{owner}/{repo}", headers=headers, timeout=10)
+        
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return 200, cached[1]
+        
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, payload)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        
+        return 200, payload
+    
+    def _graphql(self, query: str, variables: Dict[str, any]) -> Optional[Dict[str, any]]:
+        """Run a GitHub GraphQL query; None when unavailable (needs GITHUB_TOKEN)"""
+        # GitHub rejects anonymous GraphQL requests, so only use it with a token
+        token = os.environ.get("GITHUB_TOKEN")
+        if not token:
+            return None
+        
+        try:
+            with _GITHUB_REQUEST_SLOTS:
+                response = self._session.post(
+                    _GITHUB_GRAPHQL_URL,
+                    json={"query": query, "variables": variables},
+                    headers={"Authorization": f"bearer {token}"},
+                    timeout=10
+                )
+            if response.status_code != 200:
+                return None
+            
+            return response.json().get("data")
+            
+        except (requests.RequestException, ValueError) as e:
+            print(f"GraphQL request failed, falling back to REST: {e}")
+            return None
+    
+    def _store_repo_info(self, cache_key: str, entry: Dict[str, any]):
+        """Add a repo_info entry, dropping any that have outlived _REPO_INFO_TTL"""
+        now = time.time()
+        entry["fetched_at"] = now
+        with self._repo_info_lock:
+            expired = [key for key, value in self.repo_info.items() if now - value["fetched_at"] >= _REPO_INFO_TTL]
+            for key in expired:
+                del self.repo_info[key]
+            self.repo_info[cache_key] = entry
     
     def validate_github_url(self, github_url: str) -> Dict[str, any]:
         """Validate GitHub repository URL"""
+        # Reuse a recent lookup; analyze/requirements call this for the same URL
+        cache_key = self._normalize_github_url(github_url)
+        cached = self.repo_info.get(cache_key)
+        if cached and time.time() - cached["fetched_at"] < _REPO_INFO_TTL:
+            return cached["validation"]
+        
         try:
             # Basic URL validation
             if not github_url.startswith('https://github.com/'):
@@ -27,39 +206,61 @@ class GitHubRepoHandler:
                 }
             
             # Extract owner and repo
-            parsed = urlparse(github_url)
-            path_parts = parsed.path.strip('/').split('/')
+            owner_repo = self._split_owner_repo(github_url)
             
-            if len(path_parts) < 2:
+            if owner_repo is None:
                 return {
                     "valid": False,
                     "error": "Invalid GitHub URL format"
                 }
             
-            owner, repo = path_parts[0], path_parts[1]
+            owner, repo = owner_repo
             
-            # Remove .git suffix if present
-            if repo.endswith('.git'):
-                repo = repo[:-4]
+            # One GraphQL query also fetches the tree and requirements.txt
+            data = self._graphql(_REPO_QUERY, {"owner": owner, "name": repo})
+            if data is not None:
+                repository = data.get("repository")
+                if repository is None:
+                    return {
+                        "valid": False,
+                        "error": "Repository not found or is private"
+                    }
+                
+                validation = {
+                    "valid": True,
+                    "owner": owner,
+                    "repo": repo,
+                    "full_name": repository.get("nameWithOwner"),
+                    "description": repository.get("description"),
+                    "language": (repository.get("primaryLanguage") or {}).get("name"),
+                    "clone_url": github_url
+                }
+                self._store_repo_info(cache_key, {
+                    "validation": validation,
+                    # GraphQL reports blob/tree where REST reports file/dir
+                    "entries": [
+                        {"name": entry["name"], "type": "dir" if entry["type"] == "tree" else "file"}
+                        for entry in (repository.get("object") or {}).get("entries", [])
+                    ],
+                    "requirements": (repository.get("requirements") or {}).get("text")
+                })
+                return validation
             
             # Check if repository exists and is public
-            api_url = f"https://api.github.com/repos/{owner}/{repo}"
-            response = requests.get(api_url, timeout=10)
+            status_code, repo_data = self._fetch_repo_meta(owner, repo)
             
-            if response.status_code == 404:
+            if status_code == 404:
                 return {
                     "valid": False,
                     "error": "Repository not found or is private"
                 }
-            elif response.status_code != 200:
+            elif status_code != 200:
                 return {
                     "valid": False,
-                    "error": f"GitHub API error: {response.status_code}"
+                    "error": f"GitHub API error: {status_code}"
                 }
             
-            repo_data = response.json()
-            
-            return {
+            validation = {
                 "valid": True,
                 "owner": owner,
                 "repo": repo,
@@ -68,6 +269,8 @@ class GitHubRepoHandler:
                 "language": repo_data.get("language"),
                 "clone_url": github_url
             }
+            self._store_repo_info(cache_key, {"validation": validation})
+            return validation
             
         except requests.RequestException as e:
             return {
@@ -87,52 +290,19 @@ class GitHubRepoHandler:
             if not validation["valid"]:
                 return validation
             
-            owner = validation["owner"]
-            repo = validation["repo"]
-            
-            # Get repository contents
-            contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
-            response = requests.get(contents_url, timeout=10)
-            
-            if response.status_code != 200:
-                return {
-                    "valid": False,
-                    "error": "Could not access repository contents"
-                }
-            
-            contents = response.json()
-            
-            # Extract file names
-            files = [item["name"] for item in contents if item["type"] == "file"]
-            directories = [item["name"] for item in contents if item["type"] == "dir"]
-            
-            # Check for FastAPI app files
-            app_files = ["main.py", "app.py", "server.py", "api.py", "run.py"]
-            found_app_files = [f for f in app_files if f in files]
-            
-            # Check for requirements.txt
-            has_requirements = "requirements.txt" in files
-            
-            # Check for common FastAPI patterns
-            fastapi_indicators = []
-            if found_app_files:
-                fastapi_indicators.append(f"Found potential app files: {', '.join(found_app_files)}")
-            
-            if has_requirements:
-                fastapi_indicators.append("Has requirements.txt")
-            
-            if any(d in directories for d in ["api", "routes", "endpoints"]):
-                fastapi_indicators.append("Has API directory structure")
+            # The GraphQL lookup already returned the root tree
+            contents = self.repo_info.get(self._normalize_github_url(github_url), {}).get("entries")
+            if contents is None:
+                # Get repository contents
+                contents = self._fetch_contents(validation["owner"], validation["repo"])
+                
+                if contents is None:
+                    return {
+                        "valid": False,
+                        "error": "Could not access repository contents"
+                    }
             
-            return {
-                "valid": True,
-                "files": files,
-                "directories": directories,
-                "app_files": found_app_files,
-                "has_requirements": has_requirements,
-                "fastapi_indicators": fastapi_indicators,
-                "repo_info": validation
-            }
+            return self._summarize_structure(contents, validation)
             
         except Exception as e:
             return {
@@ -140,6 +310,67 @@ class GitHubRepoHandler:
                 "error": f"Analysis error: {str(e)}"
             }
     
+    def _summarize_structure(self, contents: List[Dict[str, any]], validation: Dict[str, any]) -> Dict[str, any]:
+        """Build the structure analysis from root directory entries"""
+        # Extract file names
+        files = [item["name"] for item in contents if item["type"] == "file"]
+        directories = [item["name"] for item in contents if item["type"] == "dir"]
+        
+        # Check for FastAPI app files
+        app_files = ["main.py", "app.py", "server.py", "api.py", "run.py"]
+        found_app_files = [f for f in app_files if f in files]
+        
+        # Check for requirements.txt
+        has_requirements = "requirements.txt" in files
+        
+        # Check for common FastAPI patterns
+        fastapi_indicators = []
+        if found_app_files:
+            fastapi_indicators.append(f"Found potential app files: {', '.join(found_app_files)}")
+        
+        if has_requirements:
+            fastapi_indicators.append("Has requirements.txt")
+        
+        if any(d in directories for d in ["api", "routes", "endpoints"]):
+            fastapi_indicators.append("Has API directory structure")
+        
+        return {
+            "valid": True,
+            "files": files,
+            "directories": directories,
+            "app_files": found_app_files,
+            "has_requirements": has_requirements,
+            "fastapi_indicators": fastapi_indicators,
+            "repo_info": validation
+        }
+    
+    def _fetch_contents(self, owner: str, repo: str) -> Optional[List[Dict[str, any]]]:
+        """GET the repository root listing; None on failure"""
+        contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
+        with _GITHUB_REQUEST_SLOTS:
+            response = self._session.get(contents_url, timeout=10)
+        
+        if response.status_code != 200:
+            return None
+        
+        return response.json()
+    
+    def _fetch_requirements(self, owner: str, repo: str) -> Optional[str]:
+        """GET and decode requirements.txt; None when missing"""
+        req_url = f"https://api.github.com/repos/{owner}/{repo}/contents/requirements.txt"
+        with _GITHUB_REQUEST_SLOTS:
+            # The raw media type returns the file bytes: no JSON, no base64
+            response = self._session.get(req_url, headers={"Accept": "application/vnd.github.raw"}, timeout=10)
+        
+        if response.status_code != 200:
+            return None
+        
+        # Older GitHub Enterprise servers ignore the raw type and send the JSON envelope
+        if response.headers.get("Content-Type", "").startswith("application/json"):
+            return base64.b64decode(response.json()["content"]).decode("utf-8")
+        
+        return response.content.decode("utf-8")
+    
     def get_requirements_content(self, github_url: str) -> Optional[str]:
         """Get requirements.txt content from repository"""
         try:
@@ -147,20 +378,13 @@ class GitHubRepoHandler:
             if not validation["valid"]:
                 return None
             
-            owner = validation["owner"]
-            repo = validation["repo"]
+            # The GraphQL lookup already returned requirements.txt (None if absent)
+            cached = self.repo_info.get(self._normalize_github_url(github_url), {})
+            if "requirements" in cached:
+                return cached["requirements"]
             
             # Get requirements.txt content
-            req_url = f"https://api.github.com/repos/{owner}/{repo}/contents/requirements.txt"
-            response = requests.get(req_url, timeout=10)
-            
-            if response.status_code == 200:
-                import base64
-                content_data = response.json()
-                content = base64.b64decode(content_data["content"]).decode("utf-8")
-                return content
-            
-            return None
+            return self._fetch_requirements(validation["owner"], validation["repo"])
             
         except Exception as e:
             print(f"Error getting requirements: {e}")
@@ -168,42 +392,161 @@ class GitHubRepoHandler:
     
     def clone_repository_temp(self, github_url: str) -> Tuple[bool, str, str]:
         """Clone repository to temporary directory"""
+        temp_dir = None
         try:
             # Create temporary directory
-            self.temp_dir = tempfile.mkdtemp(prefix="fastapi_deploy_")
+            temp_dir = tempfile.mkdtemp(prefix="fastapi_deploy_")
             
-            # Clone repository
+            # Snapshot of HEAD via the tarball API: no git binary, no pack
+            # negotiation and no .git directory we would never use
+            owner_repo = self._split_owner_repo(github_url)
+            if owner_repo and self._download_tarball(*owner_repo, temp_dir):
+                return True, temp_dir, "Repository downloaded successfully"
+            
+            # Start the fallback clone from an empty directory
+            if os.listdir(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                os.makedirs(temp_dir)
+            
+            # Clone repository (tarball unavailable, e.g. API rate limit). Only HEAD
+            # is read, so skip history and other branches; never prompt for
+            # credentials, so private repos fail fast instead of hitting the timeout
             result = subprocess.run(
-                ["git", "clone", github_url, self.temp_dir],
+                ["git", "clone", "--depth=1", "--single-branch", github_url, temp_dir],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"}
             )
             
             if result.returncode == 0:
-                return True, self.temp_dir, "Repository cloned successfully"
+                return True, temp_dir, "Repository cloned successfully"
             else:
-                return False, "", f"Git clone failed: {result.stderr}"
+                message = f"Git clone failed: {result.stderr}"
                 
         except subprocess.TimeoutExpired:
-            return False, "", "Clone operation timed out"
+            message = "Clone operation timed out"
         except FileNotFoundError:
-            return False, "", "Git not found. Please install Git."
+            message = "Git not found. Please install Git."
         except Exception as e:
-            return False, "", f"Clone error: {str(e)}"
+            message = f"Clone error: {str(e)}"
+        
+        # The caller gets no path on failure, so it can't clean this up itself
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return False, "", message
+    
+    def _download_tarball(self, owner: str, repo: str, dest: str) -> bool:
+        """Stream the HEAD tarball into dest, dropping its top-level folder"""
+        tarball_url = f"https://api.github.com/repos/{owner}/{repo}/tarball"
+        
+        try:
+            with _GITHUB_REQUEST_SLOTS:
+                response = self._session.get(tarball_url, stream=True, timeout=60)
+                
+                with response:
+                    if response.status_code != 200:
+                        print(f"Tarball download unavailable (HTTP {response.status_code}), using git clone")
+                        return False
+                    
+                    # Producer thread receives the download while this thread
+                    # decompresses and writes files, so network and disk overlap
+                    chunks = queue.Queue(maxsize=_TARBALL_QUEUE_SIZE)
+                    stop = threading.Event()
+                    failed = threading.Event()
+                    producer = threading.Thread(
+                        target=self._pump_chunks,
+                        args=(response, chunks, stop, failed),
+                        daemon=True
+                    )
+                    producer.start()
+                    
+                    try:
+                        extracted = self._extract_tarball(_ChunkQueueReader(chunks), dest)
+                    finally:
+                        stop.set()
+                        producer.join()
+                    
+                    if failed.is_set() or not extracted:
+                        print("Tarball download interrupted, using git clone")
+                        return False
+            
+            return True
+            
+        except (requests.RequestException, tarfile.TarError, OSError, EOFError) as e:
+            print(f"Tarball download failed, using git clone: {e}")
+            return False
+    
+    def _pump_chunks(self, response, chunks: queue.Queue, stop: threading.Event, failed: threading.Event):
+        """Producer: move downloaded chunks onto the bounded queue, then None"""
+        def put(item) -> bool:
+            # Give up if the extractor has stopped reading
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        try:
+            for chunk in response.iter_content(_TARBALL_CHUNK_SIZE):
+                if not put(chunk):
+                    return
+        except Exception:
+            failed.set()
+        
+        put(None)
     
-    def cleanup_temp_directory(self):
-        """Clean up temporary directory with Windows-specific handling"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
+    def _extract_tarball(self, fileobj, dest: str) -> int:
+        """Consumer: extract a sequential tar stream, dropping its top-level folder
+        
+        Returns the number of entries extracted.
+        """
+        extracted = 0
+        # "r|*" reads a (possibly gzipped) stream front to back
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                # Entries live under "{owner}-{repo}-{sha}/"
+                _, _, name = member.name.partition('/')
+                if not name or os.path.isabs(name) or '..' in name.split('/'):
+                    continue
+                
+                member.name = name
+                if member.islnk():
+                    member.linkname = member.linkname.partition('/')[2]
+                if hasattr(tarfile, 'data_filter'):
+                    archive.extract(member, dest, filter='data')
+                elif (member.issym() or member.islnk()) and not self._link_stays_inside(member, dest):
+                    continue
+                else:
+                    archive.extract(member, dest)
+                extracted += 1
+        
+        return extracted
+    
+    def _link_stays_inside(self, member: tarfile.TarInfo, dest: str) -> bool:
+        """Whether a link member's target resolves inside dest (the data filter's check)"""
+        root = os.path.realpath(dest)
+        # Symlinks are relative to their own directory, hard links to the archive root
+        base = os.path.dirname(os.path.join(root, member.name)) if member.issym() else root
+        target = os.path.realpath(os.path.join(base, member.linkname))
+        return os.path.commonpath([root, target]) == root
+    
+    def cleanup_temp_directory(self, temp_dir: str):
+        """Clean up temporary directory with Windows-specific handling
+        
+        Takes the directory returned by clone_repository_temp; the handler is
+        shared between concurrent deployments, so it keeps no "last clone".
+        """
+        if temp_dir and os.path.exists(temp_dir):
             try:
                 # Windows-specific cleanup for git repositories
-                self._force_remove_readonly(self.temp_dir)
-                self.temp_dir = None
+                self._force_remove_readonly(temp_dir)
                 print("✅ Temporary files cleaned up successfully")
             except Exception as e:
-                print(f"⚠️ Cleanup warning: {e}")
                 # Don't fail the whole process for cleanup issues
-                self.temp_dir = None
+                print(f"⚠️ Cleanup warning: {e}")
     
     def _force_remove_readonly(self, path):
         """Force remove read-only files (Windows git issue)"""
@@ -214,22 +557,18 @@ class GitHubRepoHandler:
                 os.chmod(path, stat.S_IWRITE)
                 func(path)
         
-        try:
-            # First try normal removal
-            shutil.rmtree(path)
-        except PermissionError:
-            try:
-                # If that fails, use Windows-specific approach
-                shutil.rmtree(path, onerror=handle_remove_readonly)
-            except Exception:
-                # Last resort: use system command
-                try:
-                    if os.name == 'nt':  # Windows
-                        subprocess.run(['cmd', '/c', 'rmdir', '/s', '/q', path], 
-                                     check=False, capture_output=True)
-                    else:
-                        subprocess.run(['rm', '-rf', path], 
-                                     check=False, capture_output=True)
-                except Exception:
-                    # If all else fails, just leave it for garbage collection
-                    pass
+        if os.name == 'nt':
+            # Windows won't delete read-only entries (git pack files); clear the
+            # flag in one bottom-up pass so a single rmtree succeeds
+            for root, dirs, files in os.walk(path, topdown=False):
+                for name in files + dirs:
+                    try:
+                        os.chmod(os.path.join(root, name), stat.S_IWRITE)
+                    except OSError:
+                        pass
+        
+        # The handler covers anything the pre-pass missed (onerror is deprecated in 3.12)
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=handle_remove_readonly)
+        else:
+            shutil.rmtree(path, onerror=handle_remove_readonly)
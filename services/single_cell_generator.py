@@ -1,64 +1,26 @@
+import re
+import string
 from typing import Dict, Optional
 
 
-class SingleCellGenerator:
-    """Generate single cell deployment code for Google Colab"""
-    
-    def generate_single_cell_deployment(self,
-                                      github_url: str,
-                                      app_file: str,
-                                      app_variable: str,
-                                      env_vars: Optional[Dict[str, str]] = None,
-                                      requirements: Optional[str] = None,
-                                      app_name: Optional[str] = None,
-                                      ngrok_auth: Optional[str] = None) -> str:
-        """Generate complete single cell deployment code"""
-        
-        # Parse requirements
-        base_packages = ["pyngrok", "fastapi", "uvicorn[standard]", "python-dotenv", "requests", "aiofiles"]
-        custom_packages = []
-        
-        if requirements:
-            for line in requirements.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    custom_packages.append(line)
-        
-        all_packages = base_packages + custom_packages
-        packages_str = ', '.join([f'"{pkg}"' for pkg in all_packages])
-        
-        # Environment variables setup
-        env_setup = ""
-        if env_vars:
-            env_lines = ["# 🔐 Setting up environment variables", "import os", ""]
-            
-            for key, value in env_vars.items():
-                # Properly escape quotes and special characters
-                escaped_value = value.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
-                env_lines.append(f'os.environ["{key}"] = "{escaped_value}"')
-            
-            env_lines.extend([
-                "",
-                f"print('✅ Set {len(env_vars)} environment variables')",
-                "print('🔐 Environment variables configured:')",
-                f"env_vars_list = {list(env_vars.keys())}",
-                "for key in env_vars_list:",
-                "    print(f'  ✓ {key}')"
-            ])
-            
-            env_setup = "\\n".join(env_lines)
-        else:
-            env_setup = 'print("ℹ️ No environment variables configured")'
-        
-        # Generate the complete single cell code
-        cell_code = f'''# 🚀 ONE-CLICK FASTAPI DEPLOYMENT
+# Leading project name of a PEP 508 requirement, before extras/version/markers
+_REQUIREMENT_NAME_RE = re.compile(r'[^\s\[<>=!~;@]*')
+
+# Whole single-cell script; only the $-placeholders vary per deployment
+_SINGLE_CELL_TEMPLATE = string.Template('''# 🚀 ONE-CLICK FASTAPI DEPLOYMENT
 # Copy this entire cell to Google Colab and run it!
 
+import glob
+import importlib.metadata
+import importlib.util
 import os
+import socket
 import subprocess
 import sys
 import time
 import threading
+import urllib.request
+import zipfile
 import requests
 from datetime import datetime
 
@@ -67,42 +29,98 @@ print("=" * 60)
 
 # Step 1: Install packages
 print("\\n📦 Installing required packages...")
-packages_to_install = [{packages_str}]
+packages_to_install = [$packages_str]
 
-for package in packages_to_install:
+def is_satisfied(package):
+    """True if the package is already importable and matches any == pin"""
+    # Options, extras, ranges, markers and URLs are left for pip to resolve
+    if package.startswith('-') or any(c in package for c in '[<>!~;@ '):
+        return False
+    name, _, pin = package.partition('==')
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", package])
-        print(f"✅ Installed: {{package}}")
-    except:
-        print(f"⚠️ Failed to install: {{package}}")
+        if importlib.util.find_spec(name.replace('-', '_')) is None:
+            return False
+        return not pin or importlib.metadata.version(name) == pin
+    except (ImportError, ValueError, importlib.metadata.PackageNotFoundError):
+        return False
+
+# Colab ships several of these already; only hand pip what's actually missing
+missing = [p for p in packages_to_install if not is_satisfied(p)]
+if len(missing) < len(packages_to_install):
+    print(f"✅ Already available: {', '.join(p for p in packages_to_install if p not in missing)}")
+packages_to_install = missing
+
+# One pip run resolves everything at once; only go package by package if it fails
+try:
+    if packages_to_install:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", *packages_to_install])
+        print(f"✅ Installed: {', '.join(packages_to_install)}")
+except subprocess.CalledProcessError:
+    print("⚠️ Bulk install failed, retrying packages individually...")
+    for package in packages_to_install:
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", package])
+            print(f"✅ Installed: {package}")
+        except:
+            print(f"⚠️ Failed to install: {package}")
 
 print("✅ Package installation completed!")
 
 # Step 2: Clone repository with enhanced support (Public/Private)
 print("\\n📥 Cloning repository...")
-github_url = "{github_url}"
+github_url = "$github_url"
+tarball_url = "$tarball_url"
 
 # Ensure clean directory
 if os.path.exists('/content/app'):
     subprocess.run(['rm', '-rf', '/content/app'], check=False)
 
+def download_tarball():
+    """Stream the HEAD snapshot straight into /content/app (no git, no .git)"""
+    os.makedirs('/content/app', exist_ok=True)
+    curl = subprocess.Popen(['curl', '-fsSL', tarball_url], stdout=subprocess.PIPE)
+    try:
+        result = subprocess.run(['tar', 'xz', '-C', '/content/app', '--strip-components=1'],
+                                stdin=curl.stdout, check=True, capture_output=True, text=True, timeout=60)
+        if curl.wait() != 0:
+            raise subprocess.CalledProcessError(curl.returncode, 'curl', stderr=f'curl exited with {curl.returncode}')
+        return result
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as error:
+        # Leave no partial target behind for the git clone fallbacks
+        subprocess.run(['rm', '-rf', '/content/app'], check=False)
+        if isinstance(error, subprocess.TimeoutExpired):
+            raise subprocess.CalledProcessError(1, 'tar', stderr='timeout while downloading tarball')
+        raise
+    finally:
+        curl.stdout.close()
+        if curl.poll() is None:
+            curl.kill()
+
+# Fail fast instead of waiting for a credentials prompt that can't be answered
+os.environ['GIT_TERMINAL_PROMPT'] = '0'
+
 # Enhanced clone methods supporting both public and private repos
 clone_success = False
 clone_methods = [
-    # Method 1: Standard git clone
-    {{
+    # Method 1: Tarball download (fastest, skips git protocol and history)
+    {
+        'name': 'Tarball Download',
+        'cmd': download_tarball
+    },
+    # Method 2: Shallow single-branch clone (only HEAD is needed)
+    {
+        'name': 'Shallow Clone',
+        'cmd': lambda: subprocess.run(['git', 'clone', '--depth', '1', '--single-branch', github_url, '/content/app'], 
+                                    check=True, capture_output=True, text=True, timeout=60)
+    },
+    # Method 3: Standard git clone (servers that don't support shallow fetches)
+    {
         'name': 'Standard Clone',
         'cmd': lambda: subprocess.run(['git', 'clone', github_url, '/content/app'], 
                                     check=True, capture_output=True, text=True, timeout=60)
-    }},
-    # Method 2: Clone with depth 1 (faster for large repos)
-    {{
-        'name': 'Shallow Clone',
-        'cmd': lambda: subprocess.run(['git', 'clone', '--depth', '1', github_url, '/content/app'], 
-                                    check=True, capture_output=True, text=True, timeout=60)
-    }},
-    # Method 3: Clone with different configs for network issues
-    {{
+    },
+    # Method 4: Clone with different configs for network issues
+    {
         'name': 'Enhanced Clone',
         'cmd': lambda: (
             subprocess.run(['git', 'config', '--global', 'http.postBuffer', '524288000'], check=False),
@@ -110,25 +128,25 @@ clone_methods = [
             subprocess.run(['git', 'clone', '--depth', '1', '--single-branch', github_url, '/content/app'], 
                          check=True, capture_output=True, text=True, timeout=90)
         )[-1]
-    }},
-    # Method 4: Alternative clone for private repos
-    {{
+    },
+    # Method 5: Alternative clone for private repos
+    {
         'name': 'Alternative Clone',
         'cmd': lambda: subprocess.run(['git', 'clone', '--recurse-submodules', '--depth', '1', github_url, '/content/app'], 
                                     check=True, capture_output=True, text=True, timeout=90)
-    }}
+    }
 ]
 
 for i, method in enumerate(clone_methods, 1):
     try:
-        print(f"🔄 {{method['name']}} (Attempt {{i}}/{{len(clone_methods)}})...")
+        print(f"🔄 {method['name']} (Attempt {i}/{len(clone_methods)})...")
         result = method['cmd']()
         clone_success = True
         print("✅ Repository cloned successfully!")
         break
     except subprocess.CalledProcessError as e:
         error_details = e.stderr.strip() if e.stderr else str(e)
-        print(f"⚠️ {{method['name']}} failed: {{error_details[:100]}}")
+        print(f"⚠️ {method['name']} failed: {error_details[:100]}")
         
         # Provide specific guidance based on error
         if 'Authentication failed' in error_details:
@@ -146,29 +164,25 @@ for i, method in enumerate(clone_methods, 1):
             print("3. ✅ **Network Issues** - Try running the cell again")
             print("4. ✅ **GitHub Status** - Check if GitHub is accessible")
             print("5. ✅ **Repository Exists** - Verify the repository exists")
-            print(f"\\n🔗 **Repository URL:** {{github_url}}")
+            print(f"\\n🔗 **Repository URL:** {github_url}")
             print("\\n⚡ **Quick Fix:** Verify the repository URL and try again!")
             
             # Don't raise exception immediately, try alternative approach
             print("\\n🔄 Attempting alternative download method...")
             try:
                 # Try downloading as ZIP if git clone fails
-                import urllib.request
-                import zipfile
-                
                 if github_url.endswith('.git'):
                     zip_url = github_url[:-4] + '/archive/main.zip'
                 else:
                     zip_url = github_url + '/archive/main.zip'
                 
-                print(f"📦 Trying ZIP download: {{zip_url}}")
+                print(f"📦 Trying ZIP download: {zip_url}")
                 urllib.request.urlretrieve(zip_url, '/tmp/repo.zip')
                 
                 with zipfile.ZipFile('/tmp/repo.zip', 'r') as zip_ref:
                     zip_ref.extractall('/content/')
                 
                 # Find the extracted folder and rename it
-                import glob
                 extracted_folders = glob.glob('/content/*-main') + glob.glob('/content/*-master')
                 if extracted_folders:
                     extracted_folder = extracted_folders[0]
@@ -178,8 +192,8 @@ for i, method in enumerate(clone_methods, 1):
                     break
                     
             except Exception as zip_error:
-                print(f"❌ ZIP download also failed: {{zip_error}}")
-                raise Exception(f"Failed to clone/download repository after all attempts. Last error: {{error_details}}")
+                print(f"❌ ZIP download also failed: {zip_error}")
+                raise Exception(f"Failed to clone/download repository after all attempts. Last error: {error_details}")
         else:
             time.sleep(2)  # Wait before retry
 
@@ -193,10 +207,9 @@ if clone_success:
         print(result.stdout)
     except:
         # Fallback to Python directory listing
-        import glob
         files = glob.glob('*') + glob.glob('.*')
         for f in sorted(files):
-            print(f"  {{f}}")
+            print(f"  {f}")
     
     # Install project requirements if exists
     if os.path.exists('requirements.txt'):
@@ -206,43 +219,41 @@ if clone_success:
                                   capture_output=True, text=True, check=True)
             print("✅ Project requirements installed!")
         except subprocess.CalledProcessError as req_error:
-            print(f"⚠️ Warning: Some requirements failed to install: {{req_error.stderr[:200]}}")
+            print(f"⚠️ Warning: Some requirements failed to install: {req_error.stderr[:200]}")
             print("🔄 Continuing with available packages...")
     else:
         print("\\n📋 No requirements.txt found - using base packages only")
 
 # Step 3: Set environment variables
 print("\\n🔐 Setting up environment variables...")
-{env_setup}
+$env_setup
 
 print("✅ Environment variables setup completed!")
 
 # Step 4: Import and start FastAPI app
 print("\\n🔍 Loading FastAPI application...")
-app_file = "{app_file}"
-app_variable = "{app_variable}"
+app_file = "$app_file"
+app_variable = "$app_variable"
 
 try:
-    import importlib.util
-    
     spec = importlib.util.spec_from_file_location('main_app', app_file)
     app_module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(app_module)
     
     if hasattr(app_module, app_variable):
         fastapi_app = getattr(app_module, app_variable)
-        print(f"✅ Found FastAPI app: {{app_variable}}")
-        print(f"📊 App type: {{type(fastapi_app)}}")
+        print(f"✅ Found FastAPI app: {app_variable}")
+        print(f"📊 App type: {type(fastapi_app)}")
     else:
-        print(f"❌ App variable '{{app_variable}}' not found in {{app_file}}")
+        print(f"❌ App variable '{app_variable}' not found in {app_file}")
         print("Available variables:")
         for attr in dir(app_module):
             if not attr.startswith('_'):
-                print(f"  - {{attr}}: {{type(getattr(app_module, attr))}}")
+                print(f"  - {attr}: {type(getattr(app_module, attr))}")
         raise Exception("App variable not found")
         
 except Exception as e:
-    print(f"❌ Error loading FastAPI app: {{e}}")
+    print(f"❌ Error loading FastAPI app: {e}")
     raise
 
 # Step 5: Start FastAPI server
@@ -256,9 +267,20 @@ def start_server():
 server_thread = threading.Thread(target=start_server, daemon=True)
 server_thread.start()
 
-# Wait for server to start
+# Wait for server to start: poll the port instead of sleeping a fixed time
+def _wait_ready(port, timeout=15):
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
 print("⏳ Waiting for server to start...")
-time.sleep(8)
+if not _wait_ready(8000):
+    raise RuntimeError("FastAPI server did not start listening on port 8000 within 15s - check the app logs above")
 print("✅ FastAPI server started on port 8000!")
 
 # Step 6: Create ngrok tunnel
@@ -289,22 +311,22 @@ try:
     
     print("\\n🎉 DEPLOYMENT SUCCESSFUL! 🎉")
     print("=" * 60)
-    print(f"🔗 PUBLIC API URL: {{public_url}}")
-    print(f"📚 Swagger UI: {{public_url}}/docs")
-    print(f"📋 ReDoc: {{public_url}}/redoc")
+    print(f"🔗 PUBLIC API URL: {public_url}")
+    print(f"📚 Swagger UI: {public_url}/docs")
+    print(f"📋 ReDoc: {public_url}/redoc")
     print("=" * 60)
     
     # Test the API
     print("\\n🧪 Testing API...")
     try:
-        response = requests.get(f"{{public_url}}/", timeout=10)
+        response = requests.get(f"{public_url}/", timeout=10)
         if response.status_code == 200:
             print("✅ API is responding correctly!")
-            print(f"📊 Response preview: {{response.text[:100]}}...")
+            print(f"📊 Response preview: {response.text[:100]}...")
         else:
-            print(f"⚠️ API returned status: {{response.status_code}}")
+            print(f"⚠️ API returned status: {response.status_code}")
     except Exception as test_error:
-        print(f"⚠️ API test failed: {{test_error}}")
+        print(f"⚠️ API test failed: {test_error}")
     
     print("\\n🎯 YOUR FASTAPI BACKEND IS NOW LIVE!")
     print("💡 Copy the PUBLIC API URL above for your frontend")
@@ -314,14 +336,14 @@ try:
     globals()['PUBLIC_API_URL'] = public_url
     
     print("\\n📱 QUICK LINKS:")
-    print(f"🏠 Homepage: {{public_url}}/")
-    print(f"📚 API Docs: {{public_url}}/docs")
-    print(f"📋 ReDoc: {{public_url}}/redoc")
+    print(f"🏠 Homepage: {public_url}/")
+    print(f"📚 API Docs: {public_url}/docs")
+    print(f"📋 ReDoc: {public_url}/redoc")
     
     print("\\n✨ DEPLOYMENT COMPLETED SUCCESSFULLY! ✨")
     
 except Exception as e:
-    print(f"❌ Failed to create ngrok tunnel: {{e}}")
+    print(f"❌ Failed to create ngrok tunnel: {e}")
     print("\\n🔧 Troubleshooting:")
     print("1. Ensure FastAPI server is running")
     print("2. Check if port 8000 is accessible")
@@ -334,32 +356,101 @@ def monitor_api():
     """Simple API monitoring function"""
     if 'PUBLIC_API_URL' in globals():
         api_url = globals()['PUBLIC_API_URL']
-        print(f"\\n🔄 Monitoring API: {{api_url}}")
+        print(f"\\n🔄 Monitoring API: {api_url}")
         print("Run this function to check API health:")
         print("monitor_api()")
         
         try:
-            response = requests.get(f"{{api_url}}/", timeout=5)
+            response = requests.get(f"{api_url}/", timeout=5)
             timestamp = datetime.now().strftime('%H:%M:%S')
             if response.status_code == 200:
-                print(f"✅ {{timestamp}} - API healthy ({{response.status_code}})")
+                print(f"✅ {timestamp} - API healthy ({response.status_code})")
             else:
-                print(f"⚠️ {{timestamp}} - API status: {{response.status_code}}")
+                print(f"⚠️ {timestamp} - API status: {response.status_code}")
         except Exception as e:
-            print(f"❌ {{timestamp}} - API check failed: {{e}}")
+            print(f"❌ {timestamp} - API check failed: {e}")
     else:
         print("❌ No API URL found")
 
 print("\\n🎯 To monitor your API, run: monitor_api()")
-'''
+''')
+
 
+class SingleCellGenerator:
+    """Generate single cell deployment code for Google Colab"""
+    
+    def generate_single_cell_deployment(self,
+                                      github_url: str,
+                                      app_file: str,
+                                      app_variable: str,
+                                      env_vars: Optional[Dict[str, str]] = None,
+                                      requirements: Optional[str] = None,
+                                      app_name: Optional[str] = None,
+                                      ngrok_auth: Optional[str] = None) -> str:
+        """Generate complete single cell deployment code"""
+        
+        # Parse requirements
+        base_packages = ["pyngrok", "fastapi", "uvicorn[standard]", "python-dotenv", "requests", "aiofiles"]
+        custom_packages = []
+        
+        if requirements:
+            for line in requirements.splitlines():
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    custom_packages.append(line)
+        
+        # One entry per project, first position kept; the repo's spec (e.g. a pinned
+        # fastapi) replaces the matching base package instead of installing it twice
+        packages = {}
+        for spec in base_packages + custom_packages:
+            packages[self._requirement_key(spec)] = spec
+        all_packages = list(packages.values())
+        packages_str = ', '.join(map('"{}"'.format, all_packages))
+        
+        # Environment variables setup
+        env_setup = ""
+        if env_vars:
+            # One list literal rather than an append loop plus extend
+            env_lines = [
+                "# 🔐 Setting up environment variables",
+                "import os",
+                "",
+                *(
+                    # Properly escape quotes and special characters
+                    f'os.environ["{key}"] = "{self._escape_env_value(value)}"'
+                    for key, value in env_vars.items()
+                ),
+                "",
+                f"print('✅ Set {len(env_vars)} environment variables')",
+                "print('🔐 Environment variables configured:')",
+                f"env_vars_list = {list(env_vars.keys())}",
+                "for key in env_vars_list:",
+                "    print(f'  ✓ {key}')"
+            ]
+            
+            env_setup = "\n".join(env_lines)
+        else:
+            env_setup = 'print("ℹ️ No environment variables configured")'
+        
+        # HEAD snapshot URL resolved here so the cell needn't parse github_url
+        repo_url = github_url.rstrip('/')
+        if repo_url.endswith('.git'):
+            repo_url = repo_url[:-4]
+        
+        # Generate the complete single cell code
+        cell_code = _SINGLE_CELL_TEMPLATE.substitute(
+            packages_str=packages_str,
+            github_url=github_url,
+            tarball_url=f"{repo_url}/archive/HEAD.tar.gz",
+            env_setup=env_setup,
+            app_file=app_file,
+            app_variable=app_variable
+        )
+        
         return cell_code
     
     def create_colab_link(self, cell_code: str) -> str:
         """Create a direct Colab link with the code"""
-        import urllib.parse
-        import base64
-        
         # Create a simple notebook structure
         notebook_content = {
             "nbformat": 4,
@@ -383,10 +474,23 @@ print("\\n🎯 To monitor your API, run: monitor_api()")
                     "execution_count": None,
                     "metadata": {},
                     "outputs": [],
-                    "source": cell_code.split('\\n')
+                    "source": cell_code
                 }
             ]
         }
         
         # For now, return instructions to manually create
         return "https://colab.research.google.com/"
+    
+    @staticmethod
+    def _escape_env_value(value: str) -> str:
+        """Escape backslashes and quotes for a double-quoted Python literal"""
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
+    
+    @staticmethod
+    def _requirement_key(spec: str) -> str:
+        """Project name pip would resolve a requirement line to (case/_ insensitive)"""
+        # Option lines (-r, --index-url, ...) are kept verbatim
+        if spec.startswith('-'):
+            return spec
+        return _REQUIREMENT_NAME_RE.match(spec).group().lower().replace('_', '-')
@@ -2,9 +2,8 @@ import streamlit as st
 from ui.styles import apply_custom_css
 import os
 
-def main_layout():
-    # Custom CSS for better styling
-    st.markdown("""
+# Page-wide styles for the classes used below
+_MAIN_HEADER_CSS = """
     <style>
     .main-header {
         text-align: center;
@@ -47,38 +46,14 @@ def main_layout():
         border-radius: 10px;
         margin: 1rem 0;
     }
+    [data-testid="stImage"] {
+        margin: 0 auto;
+    }
     </style>
-    """, unsafe_allow_html=True)
-    
-    # Main title with gradient
-    st.markdown('<h1 class="main-header">🚀 Free Python Backend Hosting</h1>', unsafe_allow_html=True)
-    
-    # Logo (only if exists)
-    logo_path = "static/logo.png"
-    if os.path.exists(logo_path):
-        col1, col2, col3 = st.columns([1, 1, 1])
-        with col2:
-            st.image(logo_path, width=150)
-    
-    # Enhanced subtitle
-    st.markdown(
-        '<p class="subtitle">Deploy your FastAPI/Flask backend to Google Colab in minutes - completely free with live public URLs!</p>', 
-        unsafe_allow_html=True
-    )
-    
-    # Key stats
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("🆓 Cost", "Free", "Always")
-    with col2:
-        st.metric("⚡ Deploy Time", "2 min", "avg")
-    with col3:
-        st.metric("🌐 Global Access", "Yes", "ngrok tunnel")
-    with col4:
-        st.metric("📚 Swagger UI", "Included", "auto-generated")
-    
-    # Enhanced deployment flow
-    st.markdown("""
+    """
+
+# "How it works" banner
+_DEPLOYMENT_FLOW_HTML = """
     <div class="deployment-flow">
         <h3>🔄 How It Works:</h3>
         <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
@@ -103,15 +78,10 @@ def main_layout():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Enhanced features overview
-    st.markdown("### ✨ Platform Features:")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
+    """
+
+# Platform feature cards
+_FEATURE_BOX_FREE = """
         <div class="feature-box">
             <div class="feature-icon">🆓</div>
             <h4>Completely Free</h4>
@@ -122,10 +92,8 @@ def main_layout():
                 <li>No hidden fees</li>
             </ul>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
+        """
+_FEATURE_BOX_REAL = """
         <div class="feature-box">
             <div class="feature-icon">⚡</div>
             <h4>Real Deployment</h4>
@@ -136,10 +104,8 @@ def main_layout():
                 <li>Smart app detection</li>
             </ul>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
+        """
+_FEATURE_BOX_URL = """
         <div class="feature-box">
             <div class="feature-icon">🔗</div>
             <h4>Live API URLs</h4>
@@ -150,10 +116,10 @@ def main_layout():
                 <li>SSL secured (HTTPS)</li>
             </ul>
         </div>
-        """, unsafe_allow_html=True)
-    
-    # What's supported
-    st.markdown("""
+        """
+
+# "What's supported" grid
+_STATS_CONTAINER_HTML = """
     <div class="stats-container">
         <h4>🎯 What's Supported:</h4>
         <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-top: 1rem;">
@@ -165,7 +131,64 @@ def main_layout():
             <div><strong>📚 Documentation:</strong> Auto Swagger UI</div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+@st.cache_resource
+def _logo_path():
+    """Logo file if the deployment ships one (checked once per process)"""
+    logo_path = "static/logo.png"
+    return logo_path if os.path.exists(logo_path) else None
+
+
+def main_layout():
+    # Custom CSS for better styling; page and widget styles go out as a single element
+    apply_custom_css(_MAIN_HEADER_CSS)
+    
+    # Main title with gradient
+    st.markdown('<h1 class="main-header">🚀 Free Python Backend Hosting</h1>', unsafe_allow_html=True)
+    
+    # Logo (only if exists); centered by the stImage rule in _MAIN_HEADER_CSS
+    logo_path = _logo_path()
+    if logo_path:
+        st.image(logo_path, width=150)
+    
+    # Enhanced subtitle
+    st.markdown(
+        '<p class="subtitle">Deploy your FastAPI/Flask backend to Google Colab in minutes - completely free with live public URLs!</p>', 
+        unsafe_allow_html=True
+    )
+    
+    # Key stats
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🆓 Cost", "Free", "Always")
+    with col2:
+        st.metric("⚡ Deploy Time", "2 min", "avg")
+    with col3:
+        st.metric("🌐 Global Access", "Yes", "ngrok tunnel")
+    with col4:
+        st.metric("📚 Swagger UI", "Included", "auto-generated")
+    
+    # Enhanced deployment flow
+    st.markdown(_DEPLOYMENT_FLOW_HTML, unsafe_allow_html=True)
+    
+    # Enhanced features overview
+    st.markdown("### ✨ Platform Features:")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(_FEATURE_BOX_FREE, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_FEATURE_BOX_REAL, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(_FEATURE_BOX_URL, unsafe_allow_html=True)
+    
+    # What's supported
+    st.markdown(_STATS_CONTAINER_HTML, unsafe_allow_html=True)
     
     # Important notice with better styling
     st.info("⚡ **Real Deployment:** This tool creates a Google Colab notebook that actually deploys your backend with Swagger UI and provides a live public API URL that works worldwide!")
@@ -190,4 +213,3 @@ def main_layout():
         """)
     
     st.markdown("---")
-    apply_custom_css()
@@ -1,56 +1,62 @@
 import streamlit as st
-import webbrowser
-import os
-import sys
+import html
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .shared import get_deployment_service
 
-from utils.colab_button import create_colab_button, display_colab_instructions, display_api_usage_examples, show_troubleshooting_tips
 
+# Static markdown blocks, built once at import instead of on every rerun
+DEPLOYMENT_TROUBLESHOOTING_MD = """
+**Common issues and solutions:**
 
-def show_deployment_response(deployment_data):
-    """Show deployment results with enhanced UI"""
-    
-    if not deployment_data['submitted'] or not deployment_data['valid_url']:
-        return
-    
-    # Initialize deployment service
-    if 'deployment_service' not in st.session_state:
-        from services.deployer import DeploymentService
-        st.session_state.deployment_service = DeploymentService()
-    
-    # Run deployment
-    with st.spinner("🚀 Preparing your deployment..."):
-        try:
-            result = st.session_state.deployment_service.deploy_repository(
-                github_url=deployment_data['github_url'],
-                env_file_content=deployment_data['env_file_content'],
-                custom_requirements=deployment_data['custom_requirements']
-            )
-            
-            if result['success']:
-                show_success_response(result)
-            else:
-                show_error_response(result)
-                
-        except Exception as e:
-            show_error_response({
-                "success": False,
-                "error": f"Deployment failed: {str(e)}",
-                "step": "deployment_execution"
-            })
+1. **Repository validation failed**
+   - Ensure the GitHub URL is correct and public
+   - Check your internet connection
 
+2. **FastAPI not detected**
+   - Verify your repository has FastAPI app with `app = FastAPI()`
+   - Check files like `main.py`, `app.py`, or similar
 
-def show_success_response(result):
-    """Display successful deployment results with enhanced UI"""
-    
-    # Success animation
-    st.success("🎉 Deployment Package Ready!")
-    st.balloons()
-    
-    # Hero section
-    st.markdown("""
+3. **File access issues (Windows)**
+   - Temporary files cleanup may show warnings (this is normal)
+   - The deployment process should still work correctly
+
+4. **Requirements issues**
+   - Ensure requirements.txt has valid package names
+   - Check for any syntax errors in the file
+
+**Need more help?** Try with a different repository or check our documentation.
+"""
+
+COMMON_SOLUTIONS_MD = """
+### Repository Issues:
+- Ensure your repository is accessible (public or private with proper access)
+- Check that it contains FastAPI code
+- Verify the GitHub URL is correct
+- Repository can be public OR private (both supported)
+
+### FastAPI Detection Issues:
+- Make sure you have `app = FastAPI()` in your code
+- Check that fastapi is imported: `from fastapi import FastAPI`
+- Ensure your main file is named main.py, app.py, or similar
+
+### Environment Variables:
+- Check .env file format: KEY=value
+- No spaces around the equals sign
+- Use quotes for values with spaces
+
+### Dependencies:
+- Verify all packages in requirements.txt are correct
+- Check for typos in package names
+- Ensure packages are available on PyPI
+
+### Network Issues:
+- Try again - temporary connectivity issues are common
+- Check your internet connection
+- Colab sometimes has temporary restrictions
+"""
+
+# Success page blocks (show_success_response)
+_HERO_HTML = """
     <div style="background: linear-gradient(90deg, #4CAF50, #45a049); padding: 20px; border-radius: 10px; margin: 20px 0;">
         <h2 style="color: white; text-align: center; margin: 0;">
             🚀 Your FastAPI Backend is Ready to Deploy!
@@ -59,105 +65,30 @@ def show_success_response(result):
             Everything is configured and ready for Google Colab deployment
         </p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Deployment Summary Cards
-    st.markdown("## 📊 Deployment Summary")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            label="📁 Repository",
-            value=result['repository_info']['repo'],
-            delta=f"by {result['repository_info']['owner']}"
-        )
-    
-    with col2:
-        st.metric(
-            label="🐍 FastAPI App",
-            value=result['fastapi_info']['app_file'],
-            delta=f"Confidence: {result['fastapi_info']['confidence']}%"
-        )
-    
-    with col3:
-        st.metric(
-            label="🔐 Environment",
-            value=f"{result['environment']['vars_count']} variables",
-            delta="Secure injection" if result['environment']['vars_count'] > 0 else "No variables"
-        )
-    
-    # Progress indicator
-    st.markdown("---")
-    st.markdown("## ✅ Preparation Steps Completed")
-    
-    progress_cols = st.columns(5)
-    steps = [
-        ("🔍", "Repository\\nValidated"),
-        ("🐍", "FastAPI App\\nDetected"),
-        ("📦", "Dependencies\\nResolved"),
-        ("🔐", "Environment\\nConfigured"),
-        ("📓", "Notebook\\nGenerated")
-    ]
-    
-    for i, (icon, step) in enumerate(steps):
-        with progress_cols[i]:
-            st.markdown(f"""
-            <div style="text-align: center; padding: 10px; background: #e8f5e8; border-radius: 8px; margin: 5px;">
-                <div style="font-size: 2em;">{icon}</div>
-                <div style="font-size: 0.8em; color: #2e7d32;">{step}</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Main deployment section
-    st.markdown("---")
-    st.markdown("## 🚀 Deploy to Google Colab")
-    
-    # Detailed step-by-step instructions
-    st.markdown("## 📋 Deployment Instructions")
-    
-    # Create tabs for different instruction formats  
-    tab1, tab2, tab3 = st.tabs(["⚡ One-Click Deploy", "📝 Detailed Guide", "🎥 Video Guide"])
-    
-    with tab1:
-        st.markdown("### ⚡ One-Click Deploy (Fastest Method)")
-        st.markdown("**Copy the code below and paste it into a single Google Colab cell, then run it!**")
-        
-        # Single cell deployment
-        if 'single_cell_code' in result and 'single_cell_path' in result:
-            # Two column layout for buttons
-            download_col1, download_col2 = st.columns([1, 1])
-            
-            with download_col1:
-                # Download single cell code as TXT file
-                if os.path.exists(result['single_cell_path']):
-                    with open(result['single_cell_path'], 'r', encoding='utf-8') as f:
-                        single_cell_txt = f.read()
-                    
-                    st.download_button(
-                        label="📥 Download Code (TXT)",
-                        data=single_cell_txt,
-                        file_name=result['single_cell_filename'],
-                        mime="text/plain",
-                        type="primary",
-                        use_container_width=True,
-                        help="Download the complete code as a text file"
-                    )
-            
-            with download_col2:
-                if st.button("🚀 Open Google Colab", type="secondary", use_container_width=True):
-                    st.markdown("🌐 **Opening Google Colab...**")
-                    st.markdown("[👆 Click here if it didn't open automatically](https://colab.research.google.com/)")
-                    # Try to open in new tab using JavaScript
-                    st.markdown("""
-                    <script>
-                    window.open('https://colab.research.google.com/', '_blank');
-                    </script>
-                    """, unsafe_allow_html=True)
-            
-            # Instructions
-            st.markdown("#### 💡 How to Use:")
-            st.info("""
+    """
+
+# Preparation step cards, laid out as one flex row (single markdown element)
+_PREPARATION_STEPS = (
+    ("🔍", "Repository<br>Validated"),
+    ("🐍", "FastAPI App<br>Detected"),
+    ("📦", "Dependencies<br>Resolved"),
+    ("🔐", "Environment<br>Configured"),
+    ("📓", "Notebook<br>Generated")
+)
+_STEP_CARD_HTML = (
+    '<div style="flex: 1; text-align: center; padding: 10px; background: #e8f5e8; border-radius: 8px;">'
+    '<div style="font-size: 2em;">{icon}</div>'
+    '<div style="font-size: 0.8em; color: #2e7d32;">{step}</div>'
+    '</div>'
+)
+_STEPS_GRID_HTML = (
+    '<div style="display: flex; gap: 10px; margin: 5px 0;">'
+    + ''.join(_STEP_CARD_HTML.format(icon=icon, step=step) for icon, step in _PREPARATION_STEPS)
+    + '</div>'
+)
+
+# One-Click Deploy tab
+_HOW_TO_USE_MD = """
             **Method 1: Download & Copy (Recommended)**
             1. 📥 Click "Download Code (TXT)" button above
             2. 🌐 Open Google Colab in new tab  
@@ -171,40 +102,16 @@ def show_success_response(result):
             **Method 2: Copy from Below**
             1. Select all code below and copy it
             2. Paste into Google Colab cell and run
-            """)
-            
-            # Code display with copy button
-            st.markdown("#### 📋 Complete Deployment Code:")
-            
-            # Enhanced code display
-            with st.expander("👀 View/Copy Code (Click to expand)", expanded=False):
-                st.code(result['single_cell_code'], language='python')
-                
-                st.markdown("""
+            """
+_COPY_INSTRUCTIONS_MD = """
                 **📝 Copy Instructions:**
                 1. **Expand** this section fully
                 2. **Select All** code (Ctrl+A or Cmd+A)  
                 3. **Copy** (Ctrl+C or Cmd+C)
                 4. **Paste** in Google Colab cell
                 5. **Run** the cell
-                """)
-            
-            # Success metrics
-            st.markdown("---")
-            st.markdown("#### 🎯 Why One-Click Deploy?")
-            
-            metrics_col1, metrics_col2, metrics_col3 = st.columns(3)
-            
-            with metrics_col1:
-                st.metric("⏱️ Time", "2-3 min", help="Total deployment time")
-            
-            with metrics_col2:
-                st.metric("🔧 Steps", "1 Cell", help="Just paste and run one cell")
-            
-            with metrics_col3:
-                st.metric("💰 Cost", "Free", help="Completely free using Google Colab")
-            
-            st.success("""
+                """
+_AUTOMATED_FEATURES_MD = """
             **🎉 Everything is automated in this single code!**
             - ✅ Package installation (fastapi, uvicorn, ngrok, etc.)
             - ✅ Repository cloning from GitHub (Public/Private both supported)
@@ -215,12 +122,10 @@ def show_success_response(result):
             - ✅ Live monitoring dashboard
             
             **🔑 Pre-configured with ngrok auth token for unlimited usage!**
-            """)
-        else:
-            st.error("Single cell code not available. Please try regenerating the deployment.")
-    
-    with tab2:
-        st.markdown("""
+            """
+
+# Instruction tabs
+_DETAILED_GUIDE_MD = """
         ### 📝 Complete Step-by-Step Guide for TXT File Deployment
         
         #### 🎯 **STEP 1: Download Code File**
@@ -271,10 +176,8 @@ def show_success_response(result):
         - Environment variables are set automatically
         - No manual configuration needed!
         - Works with both Public and Private repositories!
-        """)
-    
-    with tab3:
-        st.markdown("""
+        """
+_VIDEO_GUIDE_MD = """
         ### 🎥 Video Instructions for TXT File Deployment
         
         **🎬 Step-by-Step Video Walkthrough:**
@@ -369,39 +272,240 @@ def show_success_response(result):
         
         **⏱️ Total Time: 4-5 minutes**
         **🎥 Recommended: Record your own walkthrough for team reference!**
-        """)
+        """
+
+# Two-column and metric-row layouts rendered as a single markdown element
+_TWO_COLUMN_GRID_HTML = '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">{}</div>'
+_METRIC_CARD_HTML = (
+    '<div style="flex: 1;" title="{help}">'
+    '<div style="font-size: 0.875rem; color: #666;">{label}</div>'
+    '<div style="font-size: 2.25rem; line-height: 1.4;">{value}</div>'
+    '</div>'
+)
+
+
+def _html_section(heading, items):
+    """Heading plus bulleted list, as one cell of a _TWO_COLUMN_GRID_HTML"""
+    return heading + '<ul>' + ''.join(f'<li>{item}</li>' for item in items) + '</ul>'
+
+
+def _html_details(heading, pairs):
+    """Bold heading plus 'label: value' bullets; values come from the repo, so they're escaped"""
+    return _html_section(
+        f'<p><strong>{heading}</strong></p>',
+        [f'{label}: {html.escape(str(value))}' for label, value in pairs]
+    )
+
+
+_WHY_ONE_CLICK_HTML = (
+    '<div style="display: flex; gap: 1rem; margin-bottom: 1rem;">'
+    + _METRIC_CARD_HTML.format(label="⏱️ Time", value="2-3 min", help="Total deployment time")
+    + _METRIC_CARD_HTML.format(label="🔧 Steps", value="1 Cell", help="Just paste and run one cell")
+    + _METRIC_CARD_HTML.format(label="💰 Cost", value="Free", help="Completely free using Google Colab")
+    + '</div>'
+)
+
+# Advanced Features columns
+_ADVANCED_FEATURES_HTML = _TWO_COLUMN_GRID_HTML.format(
+    '<div>' + _html_section('<h3>🚀 <strong>Enhanced Capabilities</strong></h3>', [
+        '✅ <strong>Multi-Repository Support</strong> (Public/Private)',
+        '✅ <strong>Smart FastAPI Detection</strong>',
+        '✅ <strong>Auto Environment Variables</strong>',
+        '✅ <strong>Multi-Attempt Git Clone</strong>',
+        '✅ <strong>Pre-configured ngrok Token</strong>',
+        '✅ <strong>Error Recovery &amp; Retry</strong>',
+        '✅ <strong>Live Health Monitoring</strong>',
+        '✅ <strong>Auto Swagger UI Generation</strong>',
+    ]) + '</div>'
+    + '<div>' + _html_section('<h3>🛡️ <strong>Reliability Features</strong></h3>', [
+        '✅ <strong>3-Attempt Clone Strategy</strong>',
+        '✅ <strong>Network Error Handling</strong>',
+        '✅ <strong>Package Installation Retry</strong>',
+        '✅ <strong>Graceful Error Messages</strong>',
+        '✅ <strong>Auto-Recovery Mechanisms</strong>',
+        '✅ <strong>Comprehensive Logging</strong>',
+        '✅ <strong>Real-time Status Updates</strong>',
+        '✅ <strong>Fallback Methods</strong>',
+    ]) + '</div>'
+)
+
+_NOTEBOOK_ALTERNATIVE_MD = """
+            **Prefer traditional notebook approach?**
+            
+            Download the complete Jupyter notebook with all cells pre-configured:
+            - Individual cells for each step
+            - Detailed comments and explanations
+            - Step-by-step execution
+            - Educational value for learning
+            """
+
+
+# Large payloads left out of the raw JSON view (they're downloadable above)
+_RAW_JSON_EXCLUDED_KEYS = frozenset({"single_cell_code"})
+
+
+# Notebooks are only re-downloaded shortly after a deployment, so keep a few recent ones
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _load_notebook_bytes(path: str, deployment_id: str) -> bytes:
+    """Notebook file contents, read once per deployment rather than on every rerun"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def show_deployment_response(deployment_data):
+    """Show deployment results with enhanced UI"""
+    
+    if not deployment_data['submitted'] or not deployment_data['valid_url']:
+        return
+    
+    # Run deployment
+    with st.spinner("🚀 Preparing your deployment..."):
+        try:
+            result = get_deployment_service().deploy_repository(
+                github_url=deployment_data['github_url'],
+                env_file_content=deployment_data['env_file_content'],
+                custom_requirements=deployment_data['custom_requirements']
+            )
+            
+            if result['success']:
+                show_success_response(result)
+            else:
+                show_error_response(result)
+                
+        except Exception as e:
+            show_error_response({
+                "success": False,
+                "error": f"Deployment failed: {str(e)}",
+                "step": "deployment_execution"
+            })
+
+
+def show_success_response(result):
+    """Display successful deployment results with enhanced UI"""
+    
+    repo_info = result['repository_info']
+    fastapi_info = result['fastapi_info']
+    environment = result['environment']
+    requirements = result['requirements']
+    
+    # Success animation (once per deployment; this page re-renders on every rerun)
+    st.success("🎉 Deployment Package Ready!")
+    if st.session_state.get("celebrated_deployment_id") != result['deployment_id']:
+        st.session_state["celebrated_deployment_id"] = result['deployment_id']
+        st.balloons()
+    
+    # Hero section
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
+    
+    # Deployment Summary Cards
+    st.markdown("## 📊 Deployment Summary")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="📁 Repository",
+            value=repo_info['repo'],
+            delta=f"by {repo_info['owner']}"
+        )
+    
+    with col2:
+        st.metric(
+            label="🐍 FastAPI App",
+            value=fastapi_info['app_file'],
+            delta=f"Confidence: {fastapi_info['confidence']}%"
+        )
+    
+    with col3:
+        st.metric(
+            label="🔐 Environment",
+            value=f"{environment['vars_count']} variables",
+            delta="Secure injection" if environment['vars_count'] > 0 else "No variables"
+        )
+    
+    # Progress indicator
+    st.markdown("---")
+    st.markdown("## ✅ Preparation Steps Completed")
+    
+    st.markdown(_STEPS_GRID_HTML, unsafe_allow_html=True)
+    
+    # Main deployment section
+    st.markdown("---")
+    st.markdown("## 🚀 Deploy to Google Colab")
+    
+    # Detailed step-by-step instructions
+    st.markdown("## 📋 Deployment Instructions")
+    
+    # Switcher for the instruction formats; unlike st.tabs, only the selected body runs
+    instructions = st.radio(
+        "Instructions format",
+        ["⚡ One-Click Deploy", "📝 Detailed Guide", "🎥 Video Guide"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="instructions_format"
+    )
+    
+    if instructions == "⚡ One-Click Deploy":
+        st.markdown("### ⚡ One-Click Deploy (Fastest Method)")
+        st.markdown("**Copy the code below and paste it into a single Google Colab cell, then run it!**")
+        
+        # Single cell deployment
+        if 'single_cell_code' in result and 'single_cell_path' in result:
+            # Two column layout for buttons
+            download_col1, download_col2 = st.columns([1, 1])
+            
+            with download_col1:
+                # Download single cell code as TXT file (same text as the saved file, already in memory)
+                st.download_button(
+                    label="📥 Download Code (TXT)",
+                    data=result['single_cell_code'].encode('utf-8'),
+                    file_name=result['single_cell_filename'],
+                    mime="text/plain",
+                    type="primary",
+                    use_container_width=True,
+                    help="Download the complete code as a text file"
+                )
+            
+            with download_col2:
+                # Plain link: opens a new tab directly, no click-triggered rerun
+                st.link_button("🚀 Open Google Colab", "https://colab.research.google.com/", use_container_width=True)
+            
+            # Instructions
+            st.markdown("#### 💡 How to Use:")
+            st.info(_HOW_TO_USE_MD)
+            
+            # Code display with copy button
+            st.markdown("#### 📋 Complete Deployment Code:")
+            
+            # Enhanced code display
+            with st.expander("👀 View/Copy Code (Click to expand)", expanded=False):
+                # Collapsed expanders are still rendered, so only ship the highlighted code on request
+                if st.checkbox("Show code", key="show_single_cell_code"):
+                    st.code(result['single_cell_code'], language='python')
+                
+                st.markdown(_COPY_INSTRUCTIONS_MD)
+            
+            # Success metrics
+            st.markdown("---")
+            st.markdown("#### 🎯 Why One-Click Deploy?")
+            
+            st.markdown(_WHY_ONE_CLICK_HTML, unsafe_allow_html=True)
+            
+            st.success(_AUTOMATED_FEATURES_MD)
+        else:
+            st.error("Single cell code not available. Please try regenerating the deployment.")
+    
+    elif instructions == "📝 Detailed Guide":
+        st.markdown(_DETAILED_GUIDE_MD)
+    
+    else:
+        st.markdown(_VIDEO_GUIDE_MD)
     
     # Advanced Features Section
     st.markdown("---")
     st.markdown("## 🔥 Advanced Features")
     
-    feature_col1, feature_col2 = st.columns(2)
-    
-    with feature_col1:
-        st.markdown("""
-        ### 🚀 **Enhanced Capabilities**
-        - ✅ **Multi-Repository Support** (Public/Private)
-        - ✅ **Smart FastAPI Detection** 
-        - ✅ **Auto Environment Variables**
-        - ✅ **Multi-Attempt Git Clone**
-        - ✅ **Pre-configured ngrok Token**
-        - ✅ **Error Recovery & Retry**
-        - ✅ **Live Health Monitoring**
-        - ✅ **Auto Swagger UI Generation**
-        """)
-    
-    with feature_col2:
-        st.markdown("""
-        ### 🛡️ **Reliability Features**
-        - ✅ **3-Attempt Clone Strategy**
-        - ✅ **Network Error Handling**
-        - ✅ **Package Installation Retry**
-        - ✅ **Graceful Error Messages**
-        - ✅ **Auto-Recovery Mechanisms**
-        - ✅ **Comprehensive Logging**
-        - ✅ **Real-time Status Updates**
-        - ✅ **Fallback Methods**
-        """)
+    st.markdown(_ADVANCED_FEATURES_HTML, unsafe_allow_html=True)
     
     # Colab Notebook Alternative
     st.markdown("---")
@@ -411,21 +515,16 @@ def show_success_response(result):
         notebook_col1, notebook_col2 = st.columns([2, 1])
         
         with notebook_col1:
-            st.markdown("""
-            **Prefer traditional notebook approach?**
-            
-            Download the complete Jupyter notebook with all cells pre-configured:
-            - Individual cells for each step
-            - Detailed comments and explanations
-            - Step-by-step execution
-            - Educational value for learning
-            """)
+            st.markdown(_NOTEBOOK_ALTERNATIVE_MD)
         
         with notebook_col2:
-            if os.path.exists(result['notebook_path']):
-                with open(result['notebook_path'], 'rb') as f:
-                    notebook_data = f.read()
-                
+            # A cache hit needs no filesystem access at all; a missing file just hides the button
+            try:
+                notebook_data = _load_notebook_bytes(result['notebook_path'], result['deployment_id'])
+            except OSError:
+                notebook_data = None
+            
+            if notebook_data is not None:
                 st.download_button(
                     label="📓 Download Notebook",
                     data=notebook_data,
@@ -457,39 +556,39 @@ def show_success_response(result):
     st.markdown("## 📊 Technical Details")
     
     with st.expander("📋 Deployment Configuration", expanded=False):
-        detail_col1, detail_col2 = st.columns(2)
-        
-        with detail_col1:
-            st.markdown(f"""
-            **📁 Repository Information:**
-            - Owner: {result['repository_info']['owner']}
-            - Repository: {result['repository_info']['repo']}
-            - Language: {result['repository_info'].get('language', 'Python')}
-            - Description: {result['repository_info'].get('description', 'No description')}
-            
-            **🐍 FastAPI Detection:**
-            - App File: {result['fastapi_info']['app_file']}
-            - App Variable: {result['fastapi_info']['app_variable']}
-            - Detection Confidence: {result['fastapi_info']['confidence']}%
-            - Total Apps Found: {result['fastapi_info']['total_apps_found']}
-            """)
-        
-        with detail_col2:
-            st.markdown(f"""
-            **🔐 Environment Configuration:**
-            - Variables Count: {result['environment']['vars_count']}
-            - Has Sensitive Vars: {'Yes' if result['environment']['has_sensitive_vars'] else 'No'}
-            - Validation Warnings: {len(result['environment']['validation_warnings'])}
-            
-            **📦 Dependencies:**
-            - Has Custom Requirements: {'Yes' if result['requirements']['has_custom'] else 'No'}
-            - Source: {result['requirements']['source']}
-            - Estimated Deploy Time: {result['estimated_deployment_time']}
-            """)
+        st.markdown(_TWO_COLUMN_GRID_HTML.format(
+            '<div>'
+            + _html_details("📁 Repository Information:", [
+                ("Owner", repo_info['owner']),
+                ("Repository", repo_info['repo']),
+                ("Language", repo_info.get('language', 'Python')),
+                ("Description", repo_info.get('description', 'No description')),
+            ])
+            + _html_details("🐍 FastAPI Detection:", [
+                ("App File", fastapi_info['app_file']),
+                ("App Variable", fastapi_info['app_variable']),
+                ("Detection Confidence", f"{fastapi_info['confidence']}%"),
+                ("Total Apps Found", fastapi_info['total_apps_found']),
+            ])
+            + '</div><div>'
+            + _html_details("🔐 Environment Configuration:", [
+                ("Variables Count", environment['vars_count']),
+                ("Has Sensitive Vars", 'Yes' if environment['has_sensitive_vars'] else 'No'),
+                ("Validation Warnings", len(environment['validation_warnings'])),
+            ])
+            + _html_details("📦 Dependencies:", [
+                ("Has Custom Requirements", 'Yes' if requirements['has_custom'] else 'No'),
+                ("Source", requirements['source']),
+                ("Estimated Deploy Time", result['estimated_deployment_time']),
+            ])
+            + '</div>'
+        ), unsafe_allow_html=True)
     
     # Show raw result for debugging
     with st.expander("🔧 Debug Information", expanded=False):
-        st.json(result)
+        # Expander bodies are sent even when collapsed, so the JSON is opt-in
+        if st.checkbox("Show raw JSON", key="show_raw_json"):
+            st.json({k: v for k, v in result.items() if k not in _RAW_JSON_EXCLUDED_KEYS})
 
 
 def show_error_response(result):
@@ -507,38 +606,10 @@ def show_error_response(result):
     suggestions = result.get('suggestions', [])
     if suggestions:
         st.markdown("### 💡 Suggestions:")
-        for suggestion in suggestions:
-            st.markdown(f"- {suggestion}")
+        st.markdown("\n".join(f"- {suggestion}" for suggestion in suggestions))
     
     # Common troubleshooting
-    with st.expander("🔧 Common Solutions"):
-        st.markdown("""
-        ### Repository Issues:
-        - Ensure your repository is accessible (public or private with proper access)
-        - Check that it contains FastAPI code
-        - Verify the GitHub URL is correct
-        - Repository can be public OR private (both supported)
-        
-        ### FastAPI Detection Issues:
-        - Make sure you have `app = FastAPI()` in your code
-        - Check that fastapi is imported: `from fastapi import FastAPI`
-        - Ensure your main file is named main.py, app.py, or similar
-        
-        ### Environment Variables:
-        - Check .env file format: KEY=value
-        - No spaces around the equals sign
-        - Use quotes for values with spaces
-        
-        ### Dependencies:
-        - Verify all packages in requirements.txt are correct
-        - Check for typos in package names
-        - Ensure packages are available on PyPI
-        
-        ### Network Issues:
-        - Try again - temporary connectivity issues are common
-        - Check your internet connection
-        - Colab sometimes has temporary restrictions
-        """)
+    st.expander("🔧 Common Solutions").markdown(COMMON_SOLUTIONS_MD)
     
     # Retry option
     if st.button("🔄 Try Again", type="primary"):
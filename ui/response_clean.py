@@ -1,12 +1,9 @@
 import streamlit as st
-import webbrowser
 import os
-import sys
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.colab_button import create_colab_button, display_colab_instructions, display_api_usage_examples, show_troubleshooting_tips
+# One error view (and one set of raw JSON exclusions) for both response modules
+from .response import show_error_response, _RAW_JSON_EXCLUDED_KEYS
+from .shared import get_deployment_service
 
 
 def show_deployment_response(deployment_data):
@@ -15,15 +12,10 @@ def show_deployment_response(deployment_data):
     if not deployment_data['submitted'] or not deployment_data['valid_url']:
         return
     
-    # Initialize deployment service
-    if 'deployment_service' not in st.session_state:
-        from services.deployer import DeploymentService
-        st.session_state.deployment_service = DeploymentService()
-    
     # Run deployment
     with st.spinner("🚀 Preparing your deployment..."):
         try:
-            result = st.session_state.deployment_service.deploy_repository(
+            result = get_deployment_service().deploy_repository(
                 github_url=deployment_data['github_url'],
                 env_file_content=deployment_data['env_file_content'],
                 custom_requirements=deployment_data['custom_requirements']
@@ -84,6 +76,8 @@ def show_success_response(result):
     
     # Notebook download and Colab instructions
     if os.path.exists(result['notebook_path']):
+        from utils.colab_button import create_colab_button, display_colab_instructions, display_api_usage_examples, show_troubleshooting_tips
+        
         # Create download button and Colab link
         create_colab_button(result['notebook_path'])
         
@@ -101,54 +95,9 @@ def show_success_response(result):
     
     # Additional Info
     with st.expander("📋 Detailed Information"):
-        st.json(result)
-
-
-def show_error_response(result):
-    """Display error response with helpful guidance"""
-    
-    st.error(f"❌ Deployment Failed")
-    
-    error_message = result.get('error', 'Unknown error occurred')
-    step = result.get('step', 'unknown')
-    
-    st.markdown(f"**Error:** {error_message}")
-    st.markdown(f"**Failed at:** {step}")
-    
-    # Show suggestions based on error type
-    suggestions = result.get('suggestions', [])
-    if suggestions:
-        st.markdown("### 💡 Suggestions:")
-        for suggestion in suggestions:
-            st.markdown(f"- {suggestion}")
-    
-    # Common troubleshooting
-    with st.expander("🔧 Common Solutions"):
-        st.markdown("""
-        ### Repository Issues:
-        - Ensure your repository is public
-        - Check that it contains FastAPI code
-        - Verify the GitHub URL is correct
-        
-        ### FastAPI Detection Issues:
-        - Make sure you have `app = FastAPI()` in your code
-        - Check that fastapi is imported: `from fastapi import FastAPI`
-        - Ensure your main file is named main.py, app.py, or similar
-        
-        ### Environment Variables:
-        - Check .env file format: KEY=value
-        - No spaces around the equals sign
-        - Use quotes for values with spaces
-        
-        ### Dependencies:
-        - Verify all packages in requirements.txt are correct
-        - Check for typos in package names
-        - Ensure packages are available on PyPI
-        """)
-    
-    # Retry option
-    if st.button("🔄 Try Again", type="primary"):
-        st.rerun()
+        # Expander bodies are sent even when collapsed, so the JSON is opt-in
+        if st.checkbox("Show raw JSON", key="show_raw_json"):
+            st.json({k: v for k, v in result.items() if k not in _RAW_JSON_EXCLUDED_KEYS})
 
 
 def show_response(result):
@@ -0,0 +1,9 @@
+import streamlit as st
+
+
+@st.cache_resource
+def get_deployment_service():
+    """Deployment service shared by every session in this process"""
+    # Imported on first use so plain page renders don't pay for services.deployer
+    from services.deployer import DeploymentService
+    return DeploymentService()
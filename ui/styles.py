@@ -1,7 +1,6 @@
 import streamlit as st
 
-def apply_custom_css():
-    st.markdown("""
+_CUSTOM_CSS = """
         <style>
             .stButton>button {
                 background-color: #007bff;
@@ -19,4 +18,9 @@ def apply_custom_css():
                 border-radius: 6px;
             }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_custom_css(page_css: str = ""):
+    """Inject widget styles, plus any page styles, as one markdown element"""
+    st.markdown(page_css + _CUSTOM_CSS, unsafe_allow_html=True)
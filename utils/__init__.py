@@ -0,0 +1 @@
+# Utility helpers for Free Backend Hosting Platform
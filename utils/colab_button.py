@@ -7,6 +7,43 @@ import os
 from typing import Optional
 
 
+# Static markdown, built once at import instead of on every rerun
+TROUBLESHOOTING_TIPS_MD = """
+### Common Issues & Solutions:
+
+**❌ "FastAPI app not found"**
+- Ensure your repository has a FastAPI app instance
+- Check that FastAPI is imported: `from fastapi import FastAPI`
+- Verify app variable name (usually `app = FastAPI()`)
+
+**❌ "Requirements installation failed"**
+- Check your requirements.txt for typos
+- Ensure all packages are available on PyPI
+- Try running without custom requirements first
+
+**❌ "Environment variables not working"**
+- Verify .env file format: `KEY=value`
+- No spaces around the equals sign
+- Use quotes for values with spaces: `KEY="value with spaces"`
+
+**❌ "Ngrok tunnel failed"**
+- Wait for FastAPI server to start completely
+- Try running the ngrok cell again
+- Check if port 8000 is accessible
+
+**❌ "API not responding"**
+- Ensure your FastAPI app runs locally first
+- Check for syntax errors in your code
+- Verify all dependencies are installed
+
+### 💡 Pro Tips:
+- Keep the Colab notebook running to maintain your API
+- Colab sessions timeout after ~12 hours of inactivity
+- Save your API URL before the session ends
+- Test your API with the Swagger UI (/docs endpoint)
+"""
+
+
 def create_colab_button(notebook_path: str, button_text: str = "🚀 Open in Google Colab") -> bool:
     """Create a button to open notebook in Google Colab"""
     
@@ -204,38 +241,4 @@ curl -X POST {placeholder_url}/endpoint \\
 def show_troubleshooting_tips():
     """Display troubleshooting tips for common issues"""
     
-    with st.expander("🔧 Troubleshooting Tips"):
-        st.markdown("""
-        ### Common Issues & Solutions:
-        
-        **❌ "FastAPI app not found"**
-        - Ensure your repository has a FastAPI app instance
-        - Check that FastAPI is imported: `from fastapi import FastAPI`
-        - Verify app variable name (usually `app = FastAPI()`)
-        
-        **❌ "Requirements installation failed"**
-        - Check your requirements.txt for typos
-        - Ensure all packages are available on PyPI
-        - Try running without custom requirements first
-        
-        **❌ "Environment variables not working"**
-        - Verify .env file format: `KEY=value`
-        - No spaces around the equals sign
-        - Use quotes for values with spaces: `KEY="value with spaces"`
-        
-        **❌ "Ngrok tunnel failed"**
-        - Wait for FastAPI server to start completely
-        - Try running the ngrok cell again
-        - Check if port 8000 is accessible
-        
-        **❌ "API not responding"**
-        - Ensure your FastAPI app runs locally first
-        - Check for syntax errors in your code
-        - Verify all dependencies are installed
-        
-        ### 💡 Pro Tips:
-        - Keep the Colab notebook running to maintain your API
-        - Colab sessions timeout after ~12 hours of inactivity
-        - Save your API URL before the session ends
-        - Test your API with the Swagger UI (/docs endpoint)
-        """)
\ No newline at end of file
+    st.expander("🔧 Troubleshooting Tips").markdown(TROUBLESHOOTING_TIPS_MD)
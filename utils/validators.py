@@ -2,18 +2,23 @@
 Validation utilities
 """
 import re
+from functools import lru_cache
 from typing import Dict, List
 import requests
 
 
+_GITHUB_URL_RE = re.compile(r'^https://github\.com/[\w\-\.]+/[\w\-\.]+/?$')
+
+
+# Forms call these with the same URL on every rerun; callers must not mutate the result
+@lru_cache(maxsize=256)
 def validate_github_url(url: str) -> Dict[str, any]:
     """Validate GitHub repository URL"""
     if not url:
         return {"valid": False, "error": "URL cannot be empty"}
     
     # Check basic format
-    github_pattern = r'^https://github\.com/[\w\-\.]+/[\w\-\.]+/?$'
-    if not re.match(github_pattern, url):
+    if not _GITHUB_URL_RE.match(url):
         return {
             "valid": False, 
             "error": "Invalid GitHub URL format. Use: https://github.com/username/repository"
@@ -48,6 +53,7 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} {size_names[i]}"
 
 
+@lru_cache(maxsize=256)
 def extract_repo_name(github_url: str) -> str:
     """Extract repository name from GitHub URL"""
     try: